@@ -1,12 +1,58 @@
 """Data processing: linking commits to Jira tickets and grouping by project."""
 
+import functools
 import logging
-from typing import List, Dict, Any, Set, Optional
-from collections import defaultdict
+from operator import itemgetter
+from typing import List, Dict, Any, Set, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Commits from GitHubClient always carry a "message" (empty string if none)
+_get_message = itemgetter("message")
+
+
+def _new_project(project_key: Optional[str]) -> Dict[str, Any]:
+    """Create an empty project entry for group_by_project."""
+    return {
+        "project_key": project_key,
+        "project_name": None,
+        "commits": [],
+        "tickets": {},
+        "metrics": {
+            "total_commits": 0,
+            "total_files_changed": 0,
+            "total_additions": 0,
+            "total_deletions": 0,
+            "unique_tickets": set(),
+        },
+    }
+
+
+def _file_totals(commit: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Return (files changed, additions, deletions) for a commit."""
+    files = commit.get("files")
+    if not files:
+        return 0, 0, 0
+    additions = deletions = 0
+    for file_info in files:
+        additions += file_info.get("additions", 0)
+        deletions += file_info.get("deletions", 0)
+    return len(files), additions, deletions
+
+
+def _add_commit(
+    project: Dict[str, Any], commit: Dict[str, Any], totals: Tuple[int, int, int]
+):
+    """Append a commit to a project and add its (files, additions, deletions)."""
+    files_changed, additions, deletions = totals
+    metrics = project["metrics"]
+    project["commits"].append(commit)
+    metrics["total_commits"] += 1
+    metrics["total_files_changed"] += files_changed
+    metrics["total_additions"] += additions
+    metrics["total_deletions"] += deletions
+
 
 class DataProcessor:
     """Process and link GitHub commits with Jira tickets."""
@@ -26,6 +72,9 @@ class DataProcessor:
         """
         Link commits to their associated Jira tickets.
 
+        Commits are annotated in place with ``ticket_keys`` and ``tickets``
+        rather than copied, so the returned list shares the input dicts.
+
         Args:
             commits: List of commit dictionaries
             tickets: Dictionary mapping ticket keys to ticket details
@@ -35,17 +84,20 @@ class DataProcessor:
         """
         linked_commits = []
 
+        # Commits often share boilerplate messages (merges, reverts, templates),
+        # so parse each distinct message only once
+        @functools.lru_cache(maxsize=4096)
+        def extract(message: str) -> tuple:
+            return tuple(sorted(self.jira_client.extract_ticket_keys(message)))
+
         for commit in commits:
             commit_message = commit.get("message", "")
-            ticket_keys = self.jira_client.extract_ticket_keys(commit_message)
+            ticket_keys = extract(commit_message)
 
-            linked_commit = commit.copy()
-            linked_commit["ticket_keys"] = list(ticket_keys)
-            linked_commit["tickets"] = [
-                tickets[key] for key in ticket_keys if key in tickets
-            ]
+            commit["ticket_keys"] = list(ticket_keys)
+            commit["tickets"] = [tickets[key] for key in ticket_keys if key in tickets]
 
-            linked_commits.append(linked_commit)
+            linked_commits.append(commit)
 
         logger.info(f"Linked {len(linked_commits)} commits to tickets")
         return linked_commits
@@ -66,107 +118,70 @@ class DataProcessor:
         Returns:
             Dictionary mapping project keys to project data
         """
-        projects = defaultdict(
-            lambda: {
-                "project_key": None,
-                "project_name": None,
-                "commits": [],
-                "tickets": {},
-                "metrics": {
-                    "total_commits": 0,
-                    "total_files_changed": 0,
-                    "total_additions": 0,
-                    "total_deletions": 0,
-                    "unique_tickets": set(),
-                },
-            }
-        )
+        projects: Dict[str, Dict[str, Any]] = {}
 
         # Process commits
         for commit in linked_commits:
             ticket_keys = commit.get("ticket_keys", [])
+            # File metrics are the same for every project the commit lands in
+            totals = _file_totals(commit)
 
             if ticket_keys:
-                # Group by project from ticket keys
-                # Extract unique project keys from all ticket keys in this commit
-                project_keys_found = set()
+                # Group by project from ticket keys in a single pass; a commit is
+                # added to each project it references the first time that project
+                # is seen (commits can appear in several projects)
+                touched_projects = set()
+                ticket_by_key = {t["key"]: t for t in commit.get("tickets", [])}
+
                 for ticket_key in ticket_keys:
                     # Extract project key from ticket key (e.g., "FUI-0" -> "FUI")
-                    project_key = ticket_key.split("-")[0]
-                    project_keys_found.add(project_key)
+                    project_key = ticket_key.partition("-")[0]
+
+                    project = projects.get(project_key)
+                    if project is None:
+                        project = projects[project_key] = _new_project(None)
 
                     # Get ticket details if available
-                    tickets = commit.get("tickets", [])
-                    for ticket in tickets:
-                        if ticket["key"] == ticket_key:
-                            projects[project_key]["project_key"] = project_key
-                            projects[project_key]["project_name"] = ticket.get(
-                                "project_name", project_key
-                            )
-                            projects[project_key]["tickets"][ticket_key] = ticket
-                            projects[project_key]["metrics"]["unique_tickets"].add(
-                                ticket_key
-                            )
+                    ticket = ticket_by_key.get(ticket_key)
+                    if ticket is not None:
+                        project["project_key"] = project_key
+                        project["project_name"] = ticket.get(
+                            "project_name", project_key
+                        )
+                        project["tickets"][ticket_key] = ticket
 
                     # Always track the ticket key, even if ticket doesn't exist
-                    projects[project_key]["metrics"]["unique_tickets"].add(ticket_key)
+                    project["metrics"]["unique_tickets"].add(ticket_key)
+
+                    if project_key in touched_projects:
+                        continue
+                    touched_projects.add(project_key)
 
-                # Add commit to each project it references
-                # (commits can appear multiple times if they reference multiple tickets)
-                for project_key in project_keys_found:
                     # Initialize project if not already done
-                    if projects[project_key]["project_key"] is None:
-                        projects[project_key]["project_key"] = project_key
+                    if project["project_key"] is None:
+                        project["project_key"] = project_key
                         # Try to get project name from Jira if available
                         project_info = self.jira_client.get_project_info(project_key)
                         if project_info:
-                            projects[project_key]["project_name"] = project_info.get(
+                            project["project_name"] = project_info.get(
                                 "name", project_key
                             )
                         else:
                             # Use project key as name if we can't fetch it
-                            projects[project_key]["project_name"] = project_key
-
-                    # Add commit to project (allows duplicates if commit references multiple tickets)
-                    projects[project_key]["commits"].append(commit)
-                    projects[project_key]["metrics"]["total_commits"] += 1
+                            project["project_name"] = project_key
 
-                    # Update file metrics
-                    files = commit.get("files", [])
-                    if files:
-                        projects[project_key]["metrics"]["total_files_changed"] += len(
-                            files
-                        )
-                        for file_info in files:
-                            projects[project_key]["metrics"][
-                                "total_additions"
-                            ] += file_info.get("additions", 0)
-                            projects[project_key]["metrics"][
-                                "total_deletions"
-                            ] += file_info.get("deletions", 0)
+                    _add_commit(project, commit, totals)
             else:
                 # Unlinked commits - group by repository
                 repo = commit.get("repository", "Unknown")
                 project_key = f"UNLINKED-{repo}"
 
-                projects[project_key]["project_key"] = project_key
-                projects[project_key]["project_name"] = f"Unlinked Work - {repo}"
-                projects[project_key]["commits"].append(commit)
-                projects[project_key]["metrics"]["total_commits"] += 1
-
-                # Update file metrics
-                files = commit.get("files", [])
-                if files:
-                    projects[project_key]["metrics"]["total_files_changed"] += len(
-                        files
-                    )
-                    for file_info in files:
-                        projects[project_key]["metrics"][
-                            "total_additions"
-                        ] += file_info.get("additions", 0)
-                        projects[project_key]["metrics"][
-                            "total_deletions"
-                        ] += file_info.get("deletions", 0)
+                project = projects.get(project_key)
+                if project is None:
+                    project = projects[project_key] = _new_project(project_key)
+                    project["project_name"] = f"Unlinked Work - {repo}"
+
+                _add_commit(project, commit, totals)
 
         # Convert sets to lists for JSON serialization
         for project_data in projects.values():
@@ -178,7 +193,7 @@ class DataProcessor:
         projects = self._merge_unlinked_projects(projects)
 
         logger.info(f"Grouped data into {len(projects)} projects")
-        return dict(projects)
+        return projects
 
     def _merge_unlinked_projects(
         self, projects: Dict[str, Dict[str, Any]]
@@ -192,62 +207,50 @@ class DataProcessor:
         Returns:
             Dictionary with merged projects
         """
-        # Build a map of repository -> project_key for non-unlinked projects
+        # Single pass: bucket unlinked projects and map repository -> project_key
+        # for the others, preferring the project with more commits on a tie
         repo_to_project = {}
+        project_commit_counts = {}
+        unlinked_projects = []
         for project_key, project_data in projects.items():
-            if not project_key.startswith("UNLINKED-"):
-                # Get unique repositories from commits in this project
-                repos = set()
-                for commit in project_data.get("commits", []):
-                    repo = commit.get("repository")
-                    if repo:
-                        repos.add(repo)
-
-                # Map each repository to this project
-                for repo in repos:
-                    if repo not in repo_to_project:
-                        repo_to_project[repo] = project_key
-                    # If multiple projects share a repo, prefer the one with more commits
-                    elif len(projects[repo_to_project[repo]]["commits"]) < len(
-                        project_data["commits"]
-                    ):
-                        repo_to_project[repo] = project_key
+            if project_key.startswith("UNLINKED-"):
+                unlinked_projects.append((project_key, project_data))
+                continue
+
+            commits = project_data.get("commits", [])
+            commit_count = project_commit_counts[project_key] = len(commits)
+            repos = {c.get("repository") for c in commits if c.get("repository")}
+
+            for repo in repos:
+                current = repo_to_project.get(repo)
+                if current is None or project_commit_counts[current] < commit_count:
+                    repo_to_project[repo] = project_key
 
         # Merge unlinked projects into matching projects
-        projects_to_remove = []
-        for project_key, project_data in list(projects.items()):
-            if project_key.startswith("UNLINKED-"):
-                # Extract repository from unlinked project key (UNLINKED-repo -> repo)
-                repo = project_key.replace("UNLINKED-", "", 1)
-
-                # Check if there's a matching project for this repository
-                if repo in repo_to_project:
-                    target_project_key = repo_to_project[repo]
-                    target_project = projects[target_project_key]
-
-                    # Merge commits
-                    target_project["commits"].extend(project_data["commits"])
-                    target_project["metrics"]["total_commits"] += project_data[
-                        "metrics"
-                    ]["total_commits"]
-                    target_project["metrics"]["total_files_changed"] += project_data[
-                        "metrics"
-                    ]["total_files_changed"]
-                    target_project["metrics"]["total_additions"] += project_data[
-                        "metrics"
-                    ]["total_additions"]
-                    target_project["metrics"]["total_deletions"] += project_data[
-                        "metrics"
-                    ]["total_deletions"]
-
-                    logger.info(
-                        f"Merged unlinked project {project_key} ({len(project_data['commits'])} commits) "
-                        f"into {target_project_key}"
-                    )
-                    projects_to_remove.append(project_key)
-
-        # Remove merged unlinked projects
-        for project_key in projects_to_remove:
+        for project_key, project_data in unlinked_projects:
+            # Extract repository from unlinked project key (UNLINKED-repo -> repo)
+            repo = project_key.partition("-")[2]
+
+            # Check if there's a matching project for this repository
+            target_project_key = repo_to_project.get(repo)
+            if target_project_key is None:
+                continue
+
+            target_project = projects[target_project_key]
+            target_metrics = target_project["metrics"]
+            metrics = project_data["metrics"]
+
+            # Merge commits
+            target_project["commits"].extend(project_data["commits"])
+            target_metrics["total_commits"] += metrics["total_commits"]
+            target_metrics["total_files_changed"] += metrics["total_files_changed"]
+            target_metrics["total_additions"] += metrics["total_additions"]
+            target_metrics["total_deletions"] += metrics["total_deletions"]
+
+            logger.info(
+                f"Merged unlinked project {project_key} ({len(project_data['commits'])} commits) "
+                f"into {target_project_key}"
+            )
             del projects[project_key]
 
         return projects
@@ -264,14 +267,13 @@ class DataProcessor:
         Returns:
             Deduplicated list of commits
         """
-        seen_shas = set()
-        unique_commits = []
-
+        # dict keeps the first commit seen for each SHA, in input order
+        by_sha: Dict[str, Dict[str, Any]] = {}
         for commit in commits:
             sha = commit.get("sha")
-            if sha and sha not in seen_shas:
-                seen_shas.add(sha)
-                unique_commits.append(commit)
+            if sha:
+                by_sha.setdefault(sha, commit)
+        unique_commits = list(by_sha.values())
 
         if len(unique_commits) < len(commits):
             logger.info(
@@ -330,10 +332,12 @@ class DataProcessor:
         tickets = project_data.get("tickets", {})
 
         # Collect all text for summarization
-        commit_messages = [c.get("message", "") for c in commits]
+        commit_messages = list(map(_get_message, commits))
         ticket_summaries = [t.get("summary", "") for t in tickets.values()]
         ticket_descriptions = [
-            t.get("description", "") for t in tickets.values() if t.get("description")
+            description
+            for t in tickets.values()
+            if (description := t.get("description"))
         ]
 
         return {
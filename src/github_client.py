@@ -1,6 +1,8 @@
 """GitHub API client for fetching commits."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from github import Github
@@ -13,18 +15,23 @@ logger = logging.getLogger(__name__)
 class GitHubClient:
     """Client for interacting with GitHub API."""
 
-    def __init__(self, token: str, max_retries: int = 3):
+    def __init__(self, token: str, max_retries: int = 3, max_workers: int = 8):
         """
         Initialize GitHub client.
 
         Args:
             token: GitHub personal access token
             max_retries: Maximum number of retries for rate-limited requests
+            max_workers: Maximum number of repositories to scan concurrently
         """
         self.token = token
         self.max_retries = max_retries
+        self.max_workers = max_workers
         self.github = Github(token)
         self._user = None
+        self._login: Optional[str] = None
+        # Held by the one thread sleeping out a rate limit; others wait on it
+        self._rate_limit_lock = threading.Lock()
 
     @property
     def user(self):
@@ -33,6 +40,13 @@ class GitHubClient:
             self._user = self.github.get_user()
         return self._user
 
+    @property
+    def login(self) -> str:
+        """Get the authenticated user's login."""
+        if self._login is None:
+            self._login = self.user.login
+        return self._login
+
     def _handle_rate_limit(self, func, *args, **kwargs):
         """Handle rate limiting with retries."""
         for attempt in range(self.max_retries):
@@ -40,20 +54,31 @@ class GitHubClient:
                 return func(*args, **kwargs)
             except RateLimitExceededException as e:
                 if attempt < self.max_retries - 1:
-                    reset_time = self.github.get_rate_limit().core.reset
-                    wait_time = (
-                        max(0, (reset_time - datetime.now()).total_seconds()) + 1
-                    )
-                    logger.warning(
-                        f"Rate limit exceeded. Waiting {wait_time:.0f} seconds..."
-                    )
-                    time.sleep(wait_time)
+                    self._wait_for_rate_limit_reset()
                 else:
                     raise
             except GithubException as e:
                 logger.error(f"GitHub API error: {e}")
                 raise
 
+    def _wait_for_rate_limit_reset(self):
+        """Sleep until the rate limit resets, sharing one wait across threads."""
+        if not self._rate_limit_lock.acquire(blocking=False):
+            # Another thread is already waiting for the reset; wait with it
+            with self._rate_limit_lock:
+                return
+
+        try:
+            reset_time = self.github.get_rate_limit().core.reset
+            wait_time = (
+                max(0, (reset_time - datetime.now(reset_time.tzinfo)).total_seconds())
+                + 1
+            )
+            logger.warning(f"Rate limit exceeded. Waiting {wait_time:.0f} seconds...")
+            time.sleep(wait_time)
+        finally:
+            self._rate_limit_lock.release()
+
     def get_user_repositories(
         self,
         organizations: Optional[List[str]] = None,
@@ -90,49 +115,36 @@ class GitHubClient:
                 f"Filtering repositories: orgs={organizations}, repos={repositories}"
             )
 
+            # Lowercase the filters once; matching is then a set lookup per repo
+            # Support both "org/repo" and "repo" formats
+            org_set = {org.lower() for org in organizations or []}
+            repo_full_set = {r.lower() for r in repositories or [] if "/" in r}
+            repo_name_set = {r.lower() for r in repositories or [] if "/" not in r}
+
+            user_login = self.login.lower()
+
             filtered_repos = []
             for repo in all_repos:
                 repo_full_name = repo.full_name
-                repo_owner = (
-                    repo_full_name.split("/")[0] if "/" in repo_full_name else None
-                )
-                repo_name = (
-                    repo_full_name.split("/")[1]
-                    if "/" in repo_full_name
-                    else repo_full_name
-                )
+                owner, sep, name = repo_full_name.partition("/")
+                repo_owner = owner.lower() if sep else None
+                repo_name = name if sep else repo_full_name
 
                 # If repositories list is specified, use it (takes precedence)
                 if repositories:
-                    # Check if repo matches any in the repositories list
-                    # Support both "org/repo" and "repo" formats
-                    matches = False
-                    for repo_filter in repositories:
-                        if "/" in repo_filter:
-                            # Full format: "org/repo"
-                            if repo_filter.lower() == repo_full_name.lower():
-                                matches = True
-                                break
-                        else:
-                            # Just repo name: "repo" - matches if repo name matches
-                            if repo_filter.lower() == repo_name.lower():
-                                matches = True
-                                break
-
-                    if matches:
+                    if (
+                        repo_full_name.lower() in repo_full_set
+                        or repo_name.lower() in repo_name_set
+                    ):
                         filtered_repos.append(repo)
                 # If only organizations are specified
                 elif organizations:
-                    if repo_owner and repo_owner.lower() in [
-                        org.lower() for org in organizations
-                    ]:
+                    if repo_owner and repo_owner in org_set:
                         filtered_repos.append(repo)
                     # Also include user's own repos if username matches (for personal repos)
-                    elif repo_owner and repo_owner.lower() == self.user.login.lower():
+                    elif repo_owner and repo_owner == user_login:
                         # Check if user's login is in organizations list
-                        if self.user.login.lower() in [
-                            org.lower() for org in organizations
-                        ]:
+                        if user_login in org_set:
                             filtered_repos.append(repo)
 
             repos = filtered_repos
@@ -150,7 +162,7 @@ class GitHubClient:
         private_org_repos = {}
         for repo in repos:
             if repo.private and "/" in repo.full_name:
-                org_name = repo.full_name.split("/")[0]
+                org_name = repo.full_name.partition("/")[0]
                 if org_name not in private_org_repos:
                     private_org_repos[org_name] = 0
                 private_org_repos[org_name] += 1
@@ -185,6 +197,9 @@ class GitHubClient:
         """
         Get all commits authored by the user in the specified year.
 
+        Repositories are scanned concurrently (up to ``max_workers`` at a time)
+        since each one spends most of its time waiting on GitHub.
+
         Args:
             year: Year to fetch commits for
             username: GitHub username (defaults to authenticated user)
@@ -193,7 +208,7 @@ class GitHubClient:
             List of commit dictionaries with metadata
         """
         if username is None:
-            username = self.user.login
+            username = self.login
 
         logger.info(f"Fetching commits for {username} in year {year}")
 
@@ -211,129 +226,21 @@ class GitHubClient:
         public_repos_checked = 0
         public_repos_with_commits = 0
 
-        for repo in repos:
-            try:
-                repo_type = "private" if repo.private else "public"
+        def fetch(repo):
+            return self._get_repo_commits(repo, username, year, start_date, end_date)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # map() yields results in repository order, keeping output stable
+            for repo, repo_commits in zip(repos, executor.map(fetch, repos)):
                 if repo.private:
                     private_repos_checked += 1
+                    if repo_commits:
+                        private_repos_with_commits += 1
                 else:
                     public_repos_checked += 1
-
-                logger.info(f"Checking {repo.full_name} ({repo_type}) for commits...")
-
-                def fetch_repo_commits():
-                    # Get commits with pagination - fetch ALL commits, then filter by date
-                    # GitHub API sometimes doesn't respect date filters well, so we fetch all and filter client-side
-                    return repo.get_commits(author=username)
-
-                repo_commits = self._handle_rate_limit(fetch_repo_commits)
-
-                # Process commits with client-side date filtering
-                repo_commit_count = 0
-                total_checked = 0
-                for commit in repo_commits:
-                    try:
-                        total_checked += 1
-                        commit_date = commit.commit.author.date
-
-                        # Ensure timezone-aware for comparison
-                        if commit_date.tzinfo is None:
-                            commit_date = commit_date.replace(tzinfo=timezone.utc)
-
-                        # Client-side date filtering (backup in case API filtering fails)
-                        if commit_date < start_date:
-                            # Commits are typically in reverse chronological order
-                            # If we hit a commit before start_date, we can break (but not always reliable)
-                            # So we'll continue checking but log if we see old commits
-                            if (
-                                repo_commit_count > 100
-                            ):  # Only break if we've seen many commits
-                                logger.debug(
-                                    f"Reached commits before {year} in {repo.full_name}, stopping"
-                                )
-                                break
-                            continue
-
-                        if commit_date > end_date:
-                            continue  # Skip commits after end date
-
-                        repo_commit_count += 1
-                        commit_data = {
-                            "sha": commit.sha,
-                            "message": commit.commit.message,
-                            "author": commit.commit.author.name,
-                            "date": commit_date,
-                            "repository": repo.full_name,
-                            "url": commit.html_url,
-                            "files_changed": None,  # Will be populated if needed
-                        }
-
-                        # Get file changes if available (skip to speed up - can be slow)
-                        # Uncomment if you need file details:
-                        # try:
-                        #     files = commit.files
-                        #     commit_data["files_changed"] = len(files)
-                        #     commit_data["files"] = [
-                        #         {
-                        #             "filename": f.filename,
-                        #             "additions": f.additions,
-                        #             "deletions": f.deletions,
-                        #             "changes": f.changes,
-                        #         }
-                        #         for f in files
-                        #     ]
-                        # except Exception as e:
-                        #     logger.debug(f"Could not fetch file changes for {commit.sha}: {e}")
-
-                        commits.append(commit_data)
-                    except Exception as e:
-                        logger.warning(
-                            f"Error processing commit {commit.sha} from {repo.full_name}: {e}"
-                        )
-                        continue
-
-                if repo_commit_count > 0:
-                    logger.info(
-                        f"Found {repo_commit_count} commits from {repo.full_name} ({repo_type}) in {year}"
-                    )
-                    if repo.private:
-                        private_repos_with_commits += 1
-                    else:
+                    if repo_commits:
                         public_repos_with_commits += 1
-                else:
-                    logger.debug(
-                        f"No commits found in {repo.full_name} ({repo_type}) for {year}"
-                    )
-
-            except GithubException as e:
-                repo_type = "private" if repo.private else "public"
-                error_msg = str(e)
-                org_name = (
-                    repo.full_name.split("/")[0] if "/" in repo.full_name else None
-                )
-
-                if "403" in error_msg or "Forbidden" in error_msg:
-                    logger.error(
-                        f"Permission denied accessing {repo.full_name} ({repo_type}): {e}"
-                    )
-                    logger.error(
-                        f"  Make sure your token has 'repo' scope and access to this repository"
-                    )
-                elif "404" in error_msg or "Not Found" in error_msg:
-                    logger.warning(
-                        f"Repository {repo.full_name} ({repo_type}) not found or not accessible: {e}"
-                    )
-                else:
-                    logger.warning(
-                        f"Error fetching commits from {repo.full_name} ({repo_type}): {e}"
-                    )
-                continue
-            except Exception as e:
-                repo_type = "private" if repo.private else "public"
-                logger.error(
-                    f"Unexpected error accessing {repo.full_name} ({repo_type}): {e}"
-                )
-                continue
+                commits.extend(repo_commits)
 
         # Summary logging
         logger.info(
@@ -344,11 +251,131 @@ class GitHubClient:
         logger.info(f"Found {len(commits)} commits for {username} in {year}")
         return commits
 
+    def _get_repo_commits(
+        self,
+        repo: Any,
+        username: str,
+        year: int,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get commits authored by the user in a single repository.
+
+        Errors are logged rather than raised; commits collected before an error
+        are still returned.
+
+        Args:
+            repo: PyGithub repository
+            username: GitHub username
+            year: Year being fetched (for logging)
+            start_date: Start of the date range (inclusive)
+            end_date: End of the date range (inclusive)
+
+        Returns:
+            List of commit dictionaries with metadata
+        """
+        commits = []
+        repo_type = "private" if repo.private else "public"
+
+        try:
+            logger.info(f"Checking {repo.full_name} ({repo_type}) for commits...")
+
+            def fetch_repo_commits():
+                # The API filters on committer date, but the report uses the
+                # author date. A commit is never committed before it is
+                # authored, so `since` is safe. An `until` bound would drop
+                # commits authored in the year but rebased or merged after it.
+                return repo.get_commits(author=username, since=start_date)
+
+            repo_commits = self._handle_rate_limit(fetch_repo_commits)
+
+            # Process commits, keeping only those authored within the year
+            repo_name = repo.full_name
+            append = commits.append
+            for commit in repo_commits:
+                git_commit = commit.commit
+                author = git_commit.author
+                # Commits without author metadata can't be dated; skip them
+                if author is None or author.date is None:
+                    continue
+                commit_date = author.date
+
+                # Ensure timezone-aware for comparison
+                if commit_date.tzinfo is None:
+                    commit_date = commit_date.replace(tzinfo=timezone.utc)
+
+                if commit_date < start_date or commit_date > end_date:
+                    continue
+
+                commit_data = {
+                    "sha": commit.sha,
+                    "message": git_commit.message or "",
+                    "author": author.name,
+                    "date": commit_date,
+                    "repository": repo_name,
+                    "url": commit.html_url,
+                    "files_changed": None,  # Will be populated if needed
+                }
+
+                # Get file changes if available (skip to speed up - can be slow)
+                # Uncomment if you need file details:
+                # try:
+                #     files = commit.files
+                #     commit_data["files_changed"] = len(files)
+                #     commit_data["files"] = [
+                #         {
+                #             "filename": f.filename,
+                #             "additions": f.additions,
+                #             "deletions": f.deletions,
+                #             "changes": f.changes,
+                #         }
+                #         for f in files
+                #     ]
+                # except Exception as e:
+                #     logger.debug(f"Could not fetch file changes for {commit.sha}: {e}")
+
+                append(commit_data)
+
+            if commits:
+                logger.info(
+                    f"Found {len(commits)} commits from {repo_name} ({repo_type}) in {year}"
+                )
+            else:
+                logger.debug(
+                    f"No commits found in {repo.full_name} ({repo_type}) for {year}"
+                )
+
+        except GithubException as e:
+            error_msg = str(e)
+
+            if "403" in error_msg or "Forbidden" in error_msg:
+                logger.error(
+                    f"Permission denied accessing {repo.full_name} ({repo_type}): {e}"
+                )
+                logger.error(
+                    f"  Make sure your token has 'repo' scope and access to this repository"
+                )
+            elif "404" in error_msg or "Not Found" in error_msg:
+                logger.warning(
+                    f"Repository {repo.full_name} ({repo_type}) not found or not accessible: {e}"
+                )
+            else:
+                logger.warning(
+                    f"Error fetching commits from {repo.full_name} ({repo_type}): {e}"
+                )
+        except Exception as e:
+            logger.error(
+                f"Unexpected error accessing {repo.full_name} ({repo_type}): {e}"
+            )
+
+        return commits
+
     def get_user_info(self) -> Dict[str, Any]:
         """Get information about the authenticated user."""
         return {
-            "login": self.user.login,
-            "name": self.user.name or self.user.login,
+            "login": self.login,
+            "name": self.user.name or self.login,
             "email": self.user.email,
             "avatar_url": self.user.avatar_url,
         }
@@ -2,21 +2,52 @@
 
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
 from typing import List, Dict, Any, Set, Optional
 from jira import JIRA
 from jira.exceptions import JIRAError
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 import time
 
+from src.utils import get_backoff_delay
+
 logger = logging.getLogger(__name__)
 
+# Pattern to match Jira ticket keys: TEXT-NUMBER (e.g., FUI-0, PROJ-123).
+# Compiled once at import time and bound at module scope so the hot
+# extraction path avoids a class attribute lookup per call. Both cases are
+# matched so only the (short) matches need uppercasing, not the text. Word
+# boundaries stay Unicode-aware so the ASCII tail of a word with diacritics
+# (e.g. "błędu-3") is not read as a key.
+_TICKET_RE = re.compile(r"\b([A-Za-z][A-Za-z0-9]+-[0-9]+)\b")
+
+# Maximum number of tickets requested per JQL search
+SEARCH_BATCH_SIZE = 100
+
+# Issue fields needed to build ticket details
+TICKET_FIELDS = "summary,description,project,issuetype,status,created,updated,assignee"
+
+
+def _project_key(ticket_key: str) -> str:
+    """Return the project part of a ticket key (e.g. "FUI-12" -> "FUI")."""
+    return ticket_key.partition("-")[0]
+
 
 class JiraClient:
     """Client for interacting with Jira API."""
 
-    # Pattern to match Jira ticket keys: TEXT-NUMBER (e.g., FUI-0, PROJ-123)
-    TICKET_PATTERN = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
+    TICKET_PATTERN = _TICKET_RE
 
-    def __init__(self, url: str, email: str, api_token: str, max_retries: int = 3):
+    def __init__(
+        self,
+        url: str,
+        email: str,
+        api_token: str,
+        max_retries: int = 3,
+        max_workers: int = 8,
+    ):
         """
         Initialize Jira client.
 
@@ -25,14 +56,29 @@ class JiraClient:
             email: Jira account email
             api_token: Jira API token
             max_retries: Maximum number of retries for rate-limited requests
+            max_workers: Maximum number of concurrent Jira requests
         """
         self.url = url
         self.email = email
         self.api_token = api_token
         self.max_retries = max_retries
+        self.max_workers = max_workers
         self.jira = JIRA(
             server=url, basic_auth=(email, api_token), max_retries=max_retries
         )
+        # Keep a connection per worker alive; requests' default pool holds 10
+        # connections per host, so extra concurrent requests would reconnect
+        # (retries are left to the session and _handle_rate_limit)
+        adapter = HTTPAdapter(pool_maxsize=max(max_workers, DEFAULT_POOLSIZE))
+        self.jira._session.mount("https://", adapter)
+        self.jira._session.mount("http://", adapter)
+        # Tickets and projects don't change during a run; remember lookups
+        # (including misses) so each one is requested from Jira at most once
+        self._ticket_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._project_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        # All accessible projects are listed in one request on first lookup
+        self._projects_indexed = False
+        self._project_index_lock = threading.Lock()
 
     @staticmethod
     def extract_ticket_keys(text: str) -> Set[str]:
@@ -48,8 +94,7 @@ class JiraClient:
         if not text:
             return set()
 
-        matches = JiraClient.TICKET_PATTERN.findall(text.upper())
-        return set(matches)
+        return {match.upper() for match in _TICKET_RE.findall(text)}
 
     def _handle_rate_limit(self, func, *args, **kwargs):
         """Handle rate limiting with retries."""
@@ -59,9 +104,15 @@ class JiraClient:
             except JIRAError as e:
                 if e.status_code == 429:  # Rate limit
                     if attempt < self.max_retries - 1:
-                        wait_time = (attempt + 1) * 2  # Exponential backoff
+                        response = getattr(e, "response", None)
+                        retry_after = (
+                            response.headers.get("Retry-After")
+                            if response is not None
+                            else None
+                        )
+                        wait_time = get_backoff_delay(attempt, retry_after)
                         logger.warning(
-                            f"Rate limit exceeded. Waiting {wait_time} seconds..."
+                            f"Rate limit exceeded. Waiting {wait_time:.1f} seconds..."
                         )
                         time.sleep(wait_time)
                     else:
@@ -72,6 +123,51 @@ class JiraClient:
                 logger.error(f"Jira API error: {e}")
                 raise
 
+    def _issue_to_ticket(self, issue) -> Dict[str, Any]:
+        """Convert a jira Issue into a ticket details dictionary."""
+        return {
+            "key": issue.key,
+            "summary": issue.fields.summary,
+            "description": issue.fields.description or "",
+            "project_key": issue.fields.project.key,
+            "project_name": issue.fields.project.name,
+            "issue_type": issue.fields.issuetype.name,
+            "status": issue.fields.status.name,
+            "created": issue.fields.created,
+            "updated": issue.fields.updated,
+            "assignee": (
+                issue.fields.assignee.displayName if issue.fields.assignee else None
+            ),
+            "url": f"{self.url}/browse/{issue.key}",
+        }
+
+    def _project_to_info(self, project) -> Dict[str, Any]:
+        """Convert a jira Project into a project information dictionary."""
+        return {
+            "key": project.key,
+            "name": project.name,
+            "description": getattr(project, "description", "") or "",
+        }
+
+    def _index_projects(self):
+        """Cache every accessible project using a single projects() request."""
+        with self._project_index_lock:
+            if self._projects_indexed:
+                return
+            try:
+                projects = self._handle_rate_limit(self.jira.projects)
+                for project in projects:
+                    self._project_cache.setdefault(
+                        project.key, self._project_to_info(project)
+                    )
+                logger.debug(f"Indexed {len(projects)} Jira projects")
+            except Exception as e:
+                logger.debug(f"Listing projects failed, fetching individually: {e}")
+            finally:
+                # Set only once the listing is done, so concurrent callers wait
+                # on the lock instead of missing the still-empty cache
+                self._projects_indexed = True
+
     def get_ticket(self, ticket_key: str) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific Jira ticket.
@@ -82,6 +178,9 @@ class JiraClient:
         Returns:
             Dictionary with ticket details or None if not found
         """
+        if ticket_key in self._ticket_cache:
+            return self._ticket_cache[ticket_key]
+
         try:
 
             def fetch_ticket():
@@ -89,34 +188,58 @@ class JiraClient:
 
             issue = self._handle_rate_limit(fetch_ticket)
 
-            return {
-                "key": issue.key,
-                "summary": issue.fields.summary,
-                "description": issue.fields.description or "",
-                "project_key": issue.fields.project.key,
-                "project_name": issue.fields.project.name,
-                "issue_type": issue.fields.issuetype.name,
-                "status": issue.fields.status.name,
-                "created": issue.fields.created,
-                "updated": issue.fields.updated,
-                "assignee": (
-                    issue.fields.assignee.displayName if issue.fields.assignee else None
-                ),
-                "url": f"{self.url}/browse/{issue.key}",
-            }
+            ticket = self._ticket_cache[ticket_key] = self._issue_to_ticket(issue)
+            return ticket
         except JIRAError as e:
             if e.status_code == 404:
                 logger.warning(f"Ticket {ticket_key} not found")
+                self._ticket_cache[ticket_key] = None
                 return None
             raise
         except Exception as e:
             logger.error(f"Error fetching ticket {ticket_key}: {e}")
             return None
 
+    def _search_issues_batch(self, ticket_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch a batch of tickets with a single JQL search.
+
+        Args:
+            ticket_keys: Ticket keys to fetch (at most SEARCH_BATCH_SIZE)
+
+        Returns:
+            Dictionary mapping ticket keys to their details; keys that could
+            not be fetched this way are omitted
+        """
+        jql = f"key in ({','.join(ticket_keys)})"
+
+        def search():
+            return self.jira.search_issues(
+                jql, fields=TICKET_FIELDS, maxResults=len(ticket_keys)
+            )
+
+        try:
+            issues = self._handle_rate_limit(search)
+        except Exception as e:
+            # Jira rejects the whole query if any key is unknown (deleted or
+            # inaccessible issue); the caller falls back to per-ticket requests
+            logger.debug(f"Batch search for {len(ticket_keys)} tickets failed: {e}")
+            return {}
+
+        tickets = {issue.key: self._issue_to_ticket(issue) for issue in issues}
+        self._ticket_cache.update(tickets)
+        return tickets
+
     def get_tickets(self, ticket_keys: Set[str]) -> Dict[str, Dict[str, Any]]:
         """
         Get details for multiple Jira tickets.
 
+        Tickets are fetched with batched JQL searches (one project and at most
+        SEARCH_BATCH_SIZE keys per request); any keys a batch doesn't return
+        are fetched one by one.
+        Requests run concurrently (up to ``max_workers`` at a time) and each
+        still backs off individually when rate limited.
+
         Args:
             ticket_keys: Set of ticket keys to fetch
 
@@ -126,10 +249,42 @@ class JiraClient:
         logger.info(f"Fetching {len(ticket_keys)} Jira tickets...")
 
         tickets = {}
+        keys = []
         for ticket_key in ticket_keys:
-            ticket = self.get_ticket(ticket_key)
-            if ticket:
-                tickets[ticket_key] = ticket
+            if ticket_key in self._ticket_cache:
+                ticket = self._ticket_cache[ticket_key]
+                if ticket:
+                    tickets[ticket_key] = ticket
+            else:
+                keys.append(ticket_key)
+
+        # Batch keys per project in a stable order: a search fails as a whole
+        # if any key is unknown, so a bogus key (e.g. "UTF-8") only sends its
+        # own project's keys down the per-ticket fallback
+        batches = []
+        keys.sort()
+        for _, project_keys in groupby(keys, key=_project_key):
+            project_keys = list(project_keys)
+            batches.extend(
+                project_keys[i : i + SEARCH_BATCH_SIZE]
+                for i in range(0, len(project_keys), SEARCH_BATCH_SIZE)
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch_tickets in executor.map(self._search_issues_batch, batches):
+                tickets.update(batch_tickets)
+
+            missing_keys = [key for key in keys if key not in tickets]
+            if missing_keys:
+                logger.debug(f"Fetching {len(missing_keys)} tickets individually")
+            futures = {
+                executor.submit(self.get_ticket, ticket_key): ticket_key
+                for ticket_key in missing_keys
+            }
+            for future in as_completed(futures):
+                ticket = future.result()
+                if ticket:
+                    tickets[futures[future]] = ticket
 
         logger.info(f"Successfully fetched {len(tickets)} tickets")
         return tickets
@@ -144,6 +299,15 @@ class JiraClient:
         Returns:
             Dictionary with project information or None if not found
         """
+        if project_key in self._project_cache:
+            return self._project_cache[project_key]
+
+        if not self._projects_indexed:
+            self._index_projects()
+            if project_key in self._project_cache:
+                return self._project_cache[project_key]
+
+        # Not in the project list (e.g. archived); ask for it directly
         try:
 
             def fetch_project():
@@ -151,20 +315,20 @@ class JiraClient:
 
             project = self._handle_rate_limit(fetch_project)
 
-            return {
-                "key": project.key,
-                "name": project.name,
-                "description": getattr(project, "description", "") or "",
-            }
+            project_info = self._project_to_info(project)
         except JIRAError as e:
             if e.status_code == 404:
                 logger.warning(f"Project {project_key} not found")
+                self._project_cache[project_key] = None
                 return None
             raise
         except Exception as e:
             logger.error(f"Error fetching project {project_key}: {e}")
             return None
 
+        self._project_cache[project_key] = project_info
+        return project_info
+
     def extract_tickets_from_commits(self, commits: List[Dict[str, Any]]) -> Set[str]:
         """
         Extract all unique Jira ticket keys from a list of commits.
@@ -175,12 +339,10 @@ class JiraClient:
         Returns:
             Set of unique ticket keys
         """
-        ticket_keys = set()
-
-        for commit in commits:
-            message = commit.get("message", "")
-            keys = self.extract_ticket_keys(message)
-            ticket_keys.update(keys)
+        # Scan all messages in one pass; the record separator can't be part of
+        # a key, so no match can span two messages
+        text = "\n\x1e\n".join(commit.get("message") or "" for commit in commits)
+        ticket_keys = {match.upper() for match in _TICKET_RE.findall(text)}
 
         logger.info(f"Extracted {len(ticket_keys)} unique ticket keys from commits")
         return ticket_keys
@@ -1,22 +1,156 @@
 """Main CLI interface for Creative Work Report Generator."""
 
+import asyncio
 import click
 import logging
 import sys
-import time
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils import load_config, setup_logging, get_template_path
+from src.utils import AppConfig, load_config, setup_logging, get_template_path
 from src.github_client import GitHubClient
 from src.jira_client import JiraClient
 from src.data_processor import DataProcessor
 from src.text_processor import TextProcessor
 from src.report_generator import ReportGenerator
 
+logger = logging.getLogger(__name__)
+
+
+async def _run(
+    app_config: AppConfig,
+    year: int,
+    orgs_filter: Optional[List[str]],
+    repos_filter: Optional[List[str]],
+) -> Tuple[str, List[Dict], Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]:
+    """
+    Fetch GitHub and Jira data and generate project summaries.
+
+    The clients are blocking, so each call runs in a worker thread and
+    independent calls are awaited together.
+
+    Args:
+        app_config: Application settings
+        year: Year to fetch data for
+        orgs_filter: Organizations to search (None means all)
+        repos_filter: Repositories to search (None means all)
+
+    Returns:
+        Tuple of (employee name, commits, tickets, projects, project summaries)
+    """
+    # Initialize clients
+    logger.info("Initializing clients...")
+    github_client = GitHubClient(
+        token=app_config.github_token,
+        max_retries=app_config.github_max_retries,
+        max_workers=app_config.github_max_workers,
+    )
+
+    jira_client = JiraClient(
+        url=app_config.jira_url,
+        email=app_config.jira_email,
+        api_token=app_config.jira_api_token,
+        max_retries=app_config.jira_max_retries,
+        max_workers=app_config.jira_max_workers,
+    )
+
+    # Get user info and fetch data from GitHub
+    logger.info("Fetching data from GitHub...")
+    user_info, commits = await asyncio.gather(
+        asyncio.to_thread(github_client.get_user_info),
+        asyncio.to_thread(
+            github_client.get_commits_for_year,
+            year,
+            organizations=orgs_filter,
+            repositories=repos_filter,
+        ),
+    )
+    employee_name = user_info.get("name", user_info.get("login", "User"))
+    logger.info(f"Employee: {employee_name}")
+    logger.info(f"Found {len(commits)} commits for year {year}")
+
+    # Extract Jira ticket keys
+    logger.info("Extracting Jira ticket keys...")
+    all_ticket_keys = jira_client.extract_tickets_from_commits(commits)
+
+    logger.info(f"Found {len(all_ticket_keys)} unique Jira ticket keys")
+
+    # Fetch Jira tickets
+    tickets = {}
+    if all_ticket_keys:
+        logger.info("Fetching Jira ticket details...")
+        tickets = await asyncio.to_thread(jira_client.get_tickets, all_ticket_keys)
+        logger.info(f"Fetched {len(tickets)} tickets")
+
+    # Projects without any fetched ticket are named from Jira project info;
+    # fetch those concurrently so DataProcessor finds them cached
+    found_projects = {key.partition("-")[0] for key in tickets}
+    missing_projects = {
+        key.partition("-")[0] for key in all_ticket_keys
+    } - found_projects
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(jira_client.get_project_info, project_key)
+            for project_key in missing_projects
+        )
+    )
+
+    # Process data
+    logger.info("Processing and grouping data...")
+    data_processor = DataProcessor(jira_client)
+    projects = data_processor.process_data(commits, tickets)
+
+    logger.info(f"Grouped into {len(projects)} projects")
+
+    # Generate summaries
+    logger.info("Generating summaries...")
+    openai_key = app_config.openai_api_key
+    use_ai = openai_key is not None and openai_key != ""
+
+    if not use_ai:
+        logger.warning(
+            "OpenAI API key not provided. Using simple text processing for summaries."
+        )
+
+    text_processor = TextProcessor(
+        api_key=openai_key,
+        model=app_config.openai_model,
+        max_tokens=app_config.openai_max_tokens,
+        use_ai=use_ai,
+        requests_per_minute=app_config.openai_requests_per_minute,
+        max_retries=app_config.openai_max_retries,
+        # AI responses for unchanged projects are reused from previous runs
+        use_cache=bool(app_config.summary_cache_path),
+        cache_path=app_config.summary_cache_path,
+    )
+
+    summaries_data = [
+        data_processor.get_project_summary_data(project_key, project_data)
+        for project_key, project_data in projects.items()
+    ]
+    try:
+        if text_processor.use_ai and app_config.openai_use_batch_api:
+            # Cheaper, but the batch may take a long time to complete
+            summaries = await asyncio.to_thread(
+                text_processor.generate_project_summaries_via_batch, summaries_data
+            )
+        else:
+            # Bound the number of in-flight AI requests to avoid rate limits
+            summaries = await text_processor.agenerate_all(
+                summaries_data, concurrency=app_config.openai_max_concurrency
+            )
+    finally:
+        text_processor.close()
+    project_summaries = dict(zip(projects, summaries))
+
+    logger.info("Summaries generated")
+
+    return employee_name, commits, tickets, projects, project_summaries
+
 
 @click.command()
 @click.option(
@@ -70,42 +204,24 @@ def main(
     # Setup logging
     log_level = "DEBUG" if verbose else "INFO"
     setup_logging(log_level)
-    logger = logging.getLogger(__name__)
 
     try:
-        # Load configuration
-        cfg = load_config(config)
-
-        # Override with CLI arguments
-        if github_token:
-            cfg["github"]["token"] = github_token
-        if jira_url:
-            cfg["jira"]["url"] = jira_url
-        if jira_email:
-            cfg["jira"]["email"] = jira_email
-        if jira_token:
-            cfg["jira"]["api_token"] = jira_token
-        if openai_key:
-            cfg["openai"]["api_key"] = openai_key
-        if company_name:
-            cfg["report"]["company_name"] = company_name
-
-        # Handle organization and repository filters
-        # Empty lists mean "search all"
-        orgs_filter = (
-            list(organizations)
-            if organizations
-            else (cfg["github"].get("organizations") or [])
-        )
-        repos_filter = (
-            list(repositories)
-            if repositories
-            else (cfg["github"].get("repositories") or [])
+        # Load configuration once; CLI arguments take precedence
+        app_config = AppConfig.from_dict(
+            load_config(config),
+            github_token=github_token,
+            jira_url=jira_url,
+            jira_email=jira_email,
+            jira_api_token=jira_token,
+            openai_api_key=openai_key,
+            company_name=company_name,
+            organizations=organizations,
+            repositories=repositories,
         )
 
-        # Convert empty lists to None for "search all" behavior
-        orgs_filter = orgs_filter if orgs_filter else None
-        repos_filter = repos_filter if repos_filter else None
+        # Empty filters mean "search all"
+        orgs_filter = list(app_config.organizations) or None
+        repos_filter = list(app_config.repositories) or None
 
         if orgs_filter:
             logger.info(f"Filtering by organizations: {orgs_filter}")
@@ -115,31 +231,31 @@ def main(
             logger.info("No filters specified - searching all repositories")
 
         # Validate required configuration
-        if not cfg["github"].get("token"):
+        if not app_config.github_token:
             raise ValueError(
                 "GitHub token is required. Set GITHUB_TOKEN environment variable or use --github-token"
             )
-        if not cfg["jira"].get("url"):
+        if not app_config.jira_url:
             raise ValueError(
                 "Jira URL is required. Set JIRA_URL environment variable or use --jira-url"
             )
-        if not cfg["jira"].get("email"):
+        if not app_config.jira_email:
             raise ValueError(
                 "Jira email is required. Set JIRA_EMAIL environment variable or use --jira-email"
             )
-        if not cfg["jira"].get("api_token"):
+        if not app_config.jira_api_token:
             raise ValueError(
                 "Jira API token is required. Set JIRA_API_TOKEN environment variable or use --jira-token"
             )
         # OpenAI API key is optional - will use simple text processing if not provided
-        if not cfg["openai"].get("api_key"):
+        if not app_config.openai_api_key:
             logger.warning(
                 "OpenAI API key not provided. Summaries will be generated using simple text processing (no AI)."
             )
 
         # Set year
         if year is None:
-            year = cfg["report"].get("default_year") or datetime.now().year
+            year = app_config.default_year or datetime.now().year
 
         # Set output path
         if output is None:
@@ -149,92 +265,10 @@ def main(
 
         logger.info(f"Generating Creative Work Report for year {year}")
 
-        # Initialize clients
-        logger.info("Initializing clients...")
-        github_client = GitHubClient(
-            token=cfg["github"]["token"],
-            max_retries=cfg["github"].get("max_retries", 3),
-        )
-
-        jira_client = JiraClient(
-            url=cfg["jira"]["url"],
-            email=cfg["jira"]["email"],
-            api_token=cfg["jira"]["api_token"],
-            max_retries=cfg["jira"].get("max_retries", 3),
+        employee_name, commits, tickets, projects, project_summaries = asyncio.run(
+            _run(app_config, year, orgs_filter, repos_filter)
         )
-
-        # Get user info
-        user_info = github_client.get_user_info()
-        employee_name = user_info.get("name", user_info.get("login", "User"))
-        company = cfg["report"].get("company_name", "")
-
-        logger.info(f"Employee: {employee_name}")
-
-        # Fetch data from GitHub
-        logger.info("Fetching data from GitHub...")
-        commits = github_client.get_commits_for_year(
-            year,
-            organizations=orgs_filter if orgs_filter else None,
-            repositories=repos_filter if repos_filter else None,
-        )
-        logger.info(f"Found {len(commits)} commits for year {year}")
-
-        # Extract Jira ticket keys
-        logger.info("Extracting Jira ticket keys...")
-        all_ticket_keys = jira_client.extract_tickets_from_commits(commits)
-
-        logger.info(f"Found {len(all_ticket_keys)} unique Jira ticket keys")
-
-        # Fetch Jira tickets
-        tickets = {}
-        if all_ticket_keys:
-            logger.info("Fetching Jira ticket details...")
-            tickets = jira_client.get_tickets(all_ticket_keys)
-            logger.info(f"Fetched {len(tickets)} tickets")
-
-        # Process data
-        logger.info("Processing and grouping data...")
-        data_processor = DataProcessor(jira_client)
-        projects = data_processor.process_data(commits, tickets)
-
-        logger.info(f"Grouped into {len(projects)} projects")
-
-        # Generate summaries
-        logger.info("Generating summaries...")
-        openai_key = cfg["openai"].get("api_key")
-        use_ai = openai_key is not None and openai_key != ""
-
-        if not use_ai:
-            logger.warning(
-                "OpenAI API key not provided. Using simple text processing for summaries."
-            )
-
-        text_processor = TextProcessor(
-            api_key=openai_key,
-            model=cfg["openai"].get("model", "gpt-5"),
-            max_tokens=cfg["openai"].get("max_tokens", 50000),
-            use_ai=use_ai,
-        )
-
-        project_summaries = {}
-        project_count = len(projects)
-        for idx, (project_key, project_data) in enumerate(projects.items(), 1):
-            logger.info(
-                f"Generating summary {idx}/{project_count} for {project_key}..."
-            )
-            summary_data = data_processor.get_project_summary_data(
-                project_key, project_data
-            )
-            summary = text_processor.generate_project_summary(summary_data)
-            project_summaries[project_key] = summary
-
-            # Add delay between AI requests to avoid rate limits (only if using AI)
-            if text_processor.use_ai and idx < project_count:
-                delay = 2  # 2 second delay between requests
-                logger.debug(f"Waiting {delay} seconds before next AI request...")
-                time.sleep(delay)
-
-        logger.info("Summaries generated")
+        company = app_config.company_name
 
         # Generate report
         logger.info("Generating Excel report...")
@@ -1,15 +1,21 @@
 """XLSX report generator for Creative Work Reports."""
 
 import logging
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Collection
 from datetime import datetime
 import openpyxl
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.worksheet.cell_range import CellRange
 
 logger = logging.getLogger(__name__)
 
+# Alignment objects are immutable, so one instance is shared by every cell
+_WRAP_TOP_LEFT = Alignment(wrap_text=True, vertical="top", horizontal="left")
+
 
 class ReportGenerator:
     """Generate XLSX reports from template."""
@@ -24,14 +30,44 @@ class ReportGenerator:
         self.template_path = template_path
         self.wb = None
         self.ws = None
+        # Merged ranges indexed by each row they cover
+        self._merges_by_row: Optional[Dict[int, List[CellRange]]] = None
 
     def load_template(self):
-        """Load the Excel template."""
+        """
+        Load the Excel template.
+
+        The workbook is loaded fully editable: openpyxl's read-only and
+        write-only modes are much cheaper but cannot modify a template, and
+        rebuilding its styling, merges and comments from scratch would
+        duplicate the template in code. External link caches are skipped since
+        the report never uses them.
+        """
         logger.info(f"Loading template from {self.template_path}")
-        self.wb = openpyxl.load_workbook(self.template_path)
+        self.wb = openpyxl.load_workbook(self.template_path, keep_links=False)
         self.ws = self.wb["CreativeTime"]
+        self._index_merged_cells()
         logger.info("Template loaded successfully")
 
+    def _index_merged_cells(self):
+        """Index the worksheet's merged ranges by the rows they cover."""
+        self._merges_by_row = defaultdict(list)
+        for merged_range in self.ws.merged_cells.ranges:
+            self._add_merged_range(CellRange(merged_range.coord))
+
+    def _add_merged_range(self, cell_range: CellRange):
+        """Record a merged range in the row index."""
+        for row in range(cell_range.min_row, cell_range.max_row + 1):
+            self._merges_by_row[row].append(cell_range)
+
+    def _merge_cells(self, coord: str):
+        """Merge a range of cells (unless already merged) and index it."""
+        cell_range = CellRange(coord)
+        if cell_range in self._merges_by_row.get(cell_range.min_row, ()):
+            return
+        self.ws.merge_cells(coord)
+        self._add_merged_range(cell_range)
+
     def populate_header(self, employee_name: str, company_name: str, year: int):
         """
         Populate the header section of the report.
@@ -44,10 +80,10 @@ class ReportGenerator:
         logger.info("Populating header section")
 
         # Row 2: Employee Name
-        self.ws.cell(row=2, column=1, value=employee_name)
+        self.ws.cell(row=2, column=1).value = employee_name
 
         # Row 3: Company Name
-        self.ws.cell(row=3, column=1, value=company_name)
+        self.ws.cell(row=3, column=1).value = company_name
 
         # Row 4: Report Period
         start_date = datetime(year, 1, 1)
@@ -57,8 +93,8 @@ class ReportGenerator:
         start_str = start_date.strftime("%d %m %Y")
         end_str = end_date.strftime("%d %m %Y")
 
-        self.ws.cell(row=4, column=4, value=start_str)
-        self.ws.cell(row=4, column=6, value=end_str)
+        self.ws.cell(row=4, column=4).value = start_str
+        self.ws.cell(row=4, column=6).value = end_str
 
     def find_insertion_row(self) -> int:
         """
@@ -73,44 +109,70 @@ class ReportGenerator:
         # Look for the first row with a number in column A that we should fill
         # We'll fill existing template rows, starting from row 7
 
-        current_row = 7
+        first_row = 7
         max_search_rows = 200  # Reasonable limit to avoid searching entire sheet
 
         # Find the first row that has a number (template example) or is empty
         # We'll start filling from row 7 (first template project row)
-        while current_row <= min(self.ws.max_row, max_search_rows):
-            cell_value = self.ws.cell(row=current_row, column=1).value
-            
+        column_a = self.ws.iter_rows(
+            min_row=first_row,
+            max_row=min(self.ws.max_row, max_search_rows),
+            min_col=1,
+            max_col=1,
+            values_only=True,
+        )
+        # Each project takes 3 rows, so only every third row starts a project
+        for current_row, (cell_value,) in zip(
+            range(first_row, max_search_rows + 1, 3), islice(column_a, None, None, 3)
+        ):
             # Check if this is a project row (has a number) or empty styled row
             # We'll fill it regardless - template rows are meant to be filled
             if cell_value is None or isinstance(cell_value, (int, float)):
                 # This is a valid project row to fill
                 logger.info(f"Will fill projects starting at row {current_row}")
                 return current_row
-            
-            current_row += 3  # Each project takes 3 rows
 
         # If we didn't find a suitable row, start at row 7
         logger.info(f"Will fill projects starting at row 7")
         return 7
 
     def _unmerge_cells_in_range(
-        self, start_row: int, end_row: int, start_col: int, end_col: int
+        self,
+        start_row: int,
+        end_row: int,
+        start_col: int,
+        end_col: int,
+        keep: Collection[str] = (),
     ):
-        """Unmerge cells in the specified range."""
-        ranges_to_remove = []
-        for merged_range in list(self.ws.merged_cells.ranges):
-            # Check if merged range overlaps with our target range
-            if (
-                merged_range.min_row <= end_row
-                and merged_range.max_row >= start_row
-                and merged_range.min_col <= end_col
-                and merged_range.max_col >= start_col
-            ):
-                ranges_to_remove.append(merged_range)
-
-        for merged_range in ranges_to_remove:
-            self.ws.unmerge_cells(str(merged_range))
+        """
+        Unmerge cells in the specified range.
+
+        Args:
+            start_row: First row of the range
+            end_row: Last row of the range
+            start_col: First column of the range
+            end_col: Last column of the range
+            keep: Coordinates of merged ranges to leave in place (e.g. ranges
+                that would immediately be merged again)
+        """
+        if self._merges_by_row is None:
+            self._index_merged_cells()
+
+        # Only ranges covering the target rows can overlap; check their columns
+        ranges_to_remove = {}
+        for row in range(start_row, end_row + 1):
+            for merged_range in self._merges_by_row.get(row, ()):
+                if (
+                    merged_range.min_col <= end_col
+                    and merged_range.max_col >= start_col
+                    and merged_range.coord not in keep
+                ):
+                    ranges_to_remove[merged_range.coord] = merged_range
+
+        for coord, merged_range in ranges_to_remove.items():
+            self.ws.unmerge_cells(coord)
+            for row in range(merged_range.min_row, merged_range.max_row + 1):
+                self._merges_by_row[row].remove(merged_range)
 
     def fill_project(
         self,
@@ -137,8 +199,11 @@ class ReportGenerator:
         logger.debug(f"Filling project {project_number} at row {row}")
 
         # Unmerge any existing merged cells in the project rows (rows row to row+2, cols 1-7)
-        # This is necessary because merged cells (except the top-left) are read-only
-        self._unmerge_cells_in_range(row, row + 2, 1, 7)
+        # This is necessary because merged cells (except the top-left) are read-only.
+        # The A, B, C and F merges are re-created below, so template rows that
+        # already have them keep them (merging is expensive in openpyxl)
+        project_merges = [f"{col}{row}:{col}{row + 2}" for col in "ABCF"]
+        self._unmerge_cells_in_range(row, row + 2, 1, 7, keep=project_merges)
 
         # Template structure (based on row 6 headers):
         # Column A: Number
@@ -149,71 +214,50 @@ class ReportGenerator:
         # Column F: Final Liability (formula)
         # Column G: Approver / Date of Approval
 
+        cell = self.ws.cell
+        row2, row3 = row + 1, row + 2
+
         # Row 1 of project entry (main row) - row
-        self.ws.cell(row=row, column=1, value=project_number)  # A: Number
-        self.ws.cell(row=row, column=2, value=project_name)  # B: Project Name
-        self.ws.cell(row=row, column=3, value=creative_work_details)  # C: Creative Works Details
-        self.ws.cell(row=row, column=4, value="Contracted Time for Project")  # D: Label
+        cell(row=row, column=1).value = project_number  # A: Number
+        name_cell = cell(row=row, column=2)  # B: Project Name
+        name_cell.value = project_name
+        creative_cell = cell(row=row, column=3)  # C: Creative Works Details
+        creative_cell.value = creative_work_details
+        cell(row=row, column=4).value = "Contracted Time for Project"  # D: Label
         if contracted_time is not None:
-            self.ws.cell(row=row, column=5, value=contracted_time)  # E: Value
+            cell(row=row, column=5).value = contracted_time  # E: Value
         # F: Formula for final liability
-        formula_row = row
-        self.ws.cell(
-            row=row,
-            column=6,
-            value=f"=(E{formula_row}-E{formula_row+1})*E{formula_row+2}",
-        )  # F: Final Liability formula
-        self.ws.cell(row=row, column=7, value="Name of Approver")  # G: Approver label
+        cell(row=row, column=6).value = f"=(E{row}-E{row2})*E{row3}"
+        cell(row=row, column=7).value = "Name of Approver"  # G: Approver label
 
         # Row 2 of project entry - row + 1
         # Columns A, B, C are merged (empty)
-        self.ws.cell(row=row + 1, column=4, value="Non-Creative Time Spent on Project")  # D: Label
+        # D: Label
+        cell(row=row2, column=4).value = "Non-Creative Time Spent on Project"
         if non_creative_time is not None:
-            self.ws.cell(row=row + 1, column=5, value=non_creative_time)  # E: Value
+            cell(row=row2, column=5).value = non_creative_time  # E: Value
         # Column F is merged (empty)
         # Column G is empty
 
         # Row 3 of project entry - row + 2
         # Columns A, B, C are merged (empty)
-        self.ws.cell(row=row + 2, column=4, value="CTD allocation per EA Addendum")  # D: Label
+        cell(row=row3, column=4).value = "CTD allocation per EA Addendum"  # D: Label
         if ctd_allocation is not None:
-            self.ws.cell(row=row + 2, column=5, value=ctd_allocation)  # E: Value
+            cell(row=row3, column=5).value = ctd_allocation  # E: Value
         # Column F is merged (empty)
-        self.ws.cell(row=row + 2, column=7, value="Double click for Date")  # G: Date label
+        cell(row=row3, column=7).value = "Double click for Date"  # G: Date label
 
         # Ensure cells are merged to match template structure
-        # A, B, C, and F should be merged across all 3 rows
-        try:
-            self.ws.merge_cells(f"A{row}:A{row+2}")  # Merge column A
-        except ValueError:
-            pass  # Already merged
-        
-        try:
-            self.ws.merge_cells(f"B{row}:B{row+2}")  # Merge column B
-        except ValueError:
-            pass  # Already merged
-        
-        try:
-            self.ws.merge_cells(f"C{row}:C{row+2}")  # Merge column C
-        except ValueError:
-            pass  # Already merged
-        
-        try:
-            self.ws.merge_cells(f"F{row}:F{row+2}")  # Merge column F (formula)
-        except ValueError:
-            pass  # Already merged
-
-        # Set text wrapping and alignment for the creative work details cell (column C)
-        creative_cell = self.ws.cell(row=row, column=3)
-        creative_cell.alignment = Alignment(
-            wrap_text=True, vertical="top", horizontal="left"
-        )
-
-        # Set alignment for project name (column B)
-        name_cell = self.ws.cell(row=row, column=2)
-        name_cell.alignment = Alignment(
-            wrap_text=True, vertical="top", horizontal="left"
-        )
+        # A, B, C, and F (formula) should be merged across all 3 rows
+        for coord in project_merges:
+            try:
+                self._merge_cells(coord)
+            except ValueError:
+                pass  # Already merged
+
+        # Wrap text and align the creative work details (C) and project name (B)
+        creative_cell.alignment = _WRAP_TOP_LEFT
+        name_cell.alignment = _WRAP_TOP_LEFT
 
     def generate_report(
         self,
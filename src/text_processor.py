@@ -1,12 +1,219 @@
 """AI text processor for generating creative work summaries."""
 
+import asyncio
+import hashlib
+import importlib.util
+import io
+import json
 import logging
 import os
-from typing import Dict, Any, Optional
-from openai import OpenAI
+import re
+import shelve
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from src.utils import RateLimiter, get_backoff_delay
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # optional; prompt items are then cut by characters
 
 logger = logging.getLogger(__name__)
 
+# Section header lines in an AI response (e.g. "DETAILS: ..."); group 2 is the
+# rest of the header line
+_SECTION_RE = re.compile(
+    r"^[^\S\n]*(DESCRIPTION|DETAILS|TECHNICAL)([^\n]*)", re.IGNORECASE | re.MULTILINE
+)
+
+# Markdown code fence lines, including their line break
+_FENCE_RE = re.compile(r"^[^\S\n]*```[^\n]*(?:\n|\Z)", re.MULTILINE)
+
+# Blank lines between paragraphs
+_PARAGRAPH_RE = re.compile(r"\n{2,}")
+
+# Section headers in a batched response, e.g. "PROJECT 2 DETAILS:"
+_BATCH_SECTION_RE = re.compile(
+    r"PROJECT\s+(\d+)\s+(DESCRIPTION|DETAILS|TECHNICAL)\s*:", re.IGNORECASE
+)
+
+# Upper bound on the work details text sent for one project
+_MAX_INPUT_CHARS = 8000
+
+# HTTP/2 lets concurrent requests share one connection; it needs the optional
+# h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Errors worth retrying: throttling, timeouts and dropped connections, and
+# server-side failures
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+T = TypeVar("T")
+
+# Projects with less work text, or fewer commits and tickets together, are
+# summarized without AI
+_MIN_AI_INPUT_CHARS = 80
+_MIN_AI_WORK_ITEMS = 2
+
+# Batch job statuses after which the batch no longer changes
+_BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Fixed parts of the summary prompts, built once so every request shares them.
+# The project-specific text goes after them, keeping the prompt prefix
+# identical across requests so the provider can reuse its prompt cache.
+_PROMPT_HEADER = """You are a technical writer creating professional summaries of software development work for a Creative Work Report.
+"""
+
+_SECTION_INSTRUCTIONS = """1. DESCRIPTION: Write a concise, business-friendly description of what this project/work is about (1-2 sentences). Focus on the purpose and value of the work.
+
+2. DETAILS: Describe the specific creative work accomplished (2-4 sentences). Be specific about features, improvements, fixes, or enhancements. Reference specific tickets or commits when relevant. Avoid generic phrases like "various improvements" - be concrete.
+
+3. TECHNICAL: Provide a brief technical summary for internal tracking (1-2 sentences). Mention key technologies, patterns, or technical achievements.
+"""
+
+_PROMPT_INSTRUCTIONS = f"""{_PROMPT_HEADER}
+TASK: Analyze the work below and create a professional summary with three sections:
+
+{_SECTION_INSTRUCTIONS}
+IMPORTANT FORMATTING REQUIREMENTS:
+- Start each section with exactly: "DESCRIPTION:", "DETAILS:", or "TECHNICAL:" (all caps, followed by colon)
+- Write the content on the same line or following lines
+- Be specific and concrete - avoid generic phrases
+- Use professional, business-friendly language
+
+Example format:
+DESCRIPTION: [Your description here]
+DETAILS: [Your details here]
+TECHNICAL: [Your technical summary here]
+"""
+
+_BATCH_PROMPT_INSTRUCTIONS = f"""{_PROMPT_HEADER}
+TASK: Analyze the work of EACH project below and create a professional summary with three sections:
+
+{_SECTION_INSTRUCTIONS}
+IMPORTANT FORMATTING REQUIREMENTS:
+- Summarize every project, in order, and never mix work from different projects
+- Start each section with exactly: "PROJECT <n> DESCRIPTION:", "PROJECT <n> DETAILS:", or "PROJECT <n> TECHNICAL:" (all caps, followed by colon), where <n> is the project number
+- Write the content on the same line or following lines
+- Be specific and concrete - avoid generic phrases
+- Use professional, business-friendly language
+
+Example format:
+PROJECT 1 DESCRIPTION: [Your description here]
+PROJECT 1 DETAILS: [Your details here]
+PROJECT 1 TECHNICAL: [Your technical summary here]
+PROJECT 2 DESCRIPTION: [Your description here]
+...
+"""
+
+
+def _response_output_text(body: Dict[str, Any]) -> str:
+    """Concatenate the output text of a raw Responses API result."""
+    return "".join(
+        part.get("text", "")
+        for item in body.get("output", [])
+        if item.get("type") == "message"
+        for part in item.get("content", [])
+        if part.get("type") == "output_text"
+    )
+
+
+def _summary_complete(text: str) -> bool:
+    """
+    Check whether a partial AI response already holds every summary section.
+
+    TECHNICAL is the last section requested, so the response is complete once
+    all three headers were seen and a blank line follows the TECHNICAL text.
+    A blank line after only a short lead-in (e.g. "Key points:") does not
+    count. A later paragraph of the section can still be cut off, so
+    early-stopped responses are not cached.
+    """
+    matches = list(_SECTION_RE.finditer(text))
+    if (
+        len({m.group(1).upper() for m in matches}) < 3
+        or matches[-1].group(1).upper() != "TECHNICAL"
+    ):
+        return False
+    header_text = matches[-1].group(2).partition(":")[2]
+    rest = text[matches[-1].end() :]
+    # With nothing after the header's colon, the section text starts on a later
+    # line, so blank lines before it don't end the section
+    if not header_text.strip():
+        rest = rest.lstrip()
+    section, blank_line, _ = rest.partition("\n\n")
+    section = f"{header_text}{section}".strip()
+    # Same minimum length the parser requires of a technical summary
+    return bool(blank_line) and len(section) >= 10 and not section.endswith(":")
+
+
+def _classify_commit(message: str) -> str:
+    """Return the simple-summary category of a commit message.
+
+    Categories are tried in priority order: a conventional prefix, or a
+    keyword anywhere in the message.
+    """
+    lower = message.lower()
+    if lower.startswith("feat") or "feature" in lower:
+        return "features"
+    if lower.startswith("fix") or "bug" in lower:
+        return "fixes"
+    if lower.startswith("refactor"):
+        return "refactoring"
+    return "improvements"
+
+
+# Default location of the on-disk AI response cache
+DEFAULT_CACHE_PATH = ".cache/cwr_summaries"
+
+
+class _SummaryCache:
+    """Thread-safe on-disk cache of AI responses, keyed by request hash."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stats = {"hits": 0, "misses": 0}
+        self._shelf = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> shelve.Shelf:
+        # Opened on first use so processors that never call the API don't
+        # create the cache file
+        if self._shelf is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._shelf = shelve.open(self.path)
+        return self._shelf
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None."""
+        with self._lock:
+            content = self._open().get(key)
+            self.stats["hits" if content is not None else "misses"] += 1
+            return content
+
+    def set(self, key: str, content: str):
+        """Store a response."""
+        with self._lock:
+            self._open()[key] = content
+
+    def close(self):
+        """Write the cache to disk and release it."""
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+
 
 class TextProcessor:
     """Generate creative work summaries using AI."""
@@ -17,22 +224,38 @@ class TextProcessor:
         model: str = "gpt-5.1",
         max_tokens: int = 500,
         use_ai: bool = True,
+        requests_per_minute: Optional[float] = None,
+        use_cache: bool = True,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+        max_retries: int = 5,
     ):
         """
         Initialize text processor.
         """
         final_api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.max_retries = max_retries
+        # Token encoding for cutting prompt items (None: cut by characters)
+        self._encoding = None
         self.use_ai = use_ai and final_api_key is not None
-
+        # Shared by all threads generating summaries (None means unlimited)
+        self.rate_limiter = (
+            RateLimiter(requests_per_minute) if requests_per_minute else None
+        )
         if self.use_ai:
             try:
-                self.client = self.client = OpenAI(
+                # Retries are done by _with_retries/_awith_retries, which also
+                # slow down the shared rate limiter when throttled
+                self.client = OpenAI(
                     api_key=final_api_key,
-                    max_retries=5,  # Let GPT handle rate-limit & server retries
+                    max_retries=0,
                     timeout=30,
+                    http_client=DefaultHttpxClient(http2=_HTTP2_AVAILABLE),
                 )
+                # agenerate_all creates its own async client with this key
+                self._api_key = final_api_key
                 self.model = model
                 self.max_tokens = max_tokens
+                self._encoding = self._load_encoding(model)
                 logger.info(
                     f"Initialized OpenAI client with model={model}, "
                     f"max_tokens={max_tokens}"
@@ -50,31 +273,161 @@ class TextProcessor:
             else:
                 logger.info("AI summarization disabled—using simple text processing.")
 
-    def generate_project_summary(self, project_data: Dict[str, Any]) -> Dict[str, str]:
-        """Generate creative work summary for a project."""
+        # Identical requests (same model, prompt and token limit) are answered
+        # from disk; only successful, non-empty responses are stored. Created
+        # once the client is set up, as there is nothing to cache otherwise
+        self._cache = (
+            _SummaryCache(cache_path)
+            if use_cache and cache_path and self.use_ai
+            else None
+        )
 
-        logger.info(f"Generating summary for project {project_data.get('project_key')}")
+    @staticmethod
+    def _load_encoding(model: str):
+        """Return the tiktoken encoding for a model, or None if unavailable."""
+        if tiktoken is None:
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                # Model unknown to this tiktoken version; use the newest encoding
+                return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            # Encodings are downloaded on first use, which can fail offline
+            logger.warning(f"Failed to load tiktoken encoding: {e}")
+            return None
+
+    def _truncate(self, text: str, max_tokens: int, max_chars: int) -> str:
+        """Cut text to a token budget, or a character budget without tiktoken."""
+        if self._encoding is None:
+            return text[:max_chars]
+        # Every token spans at least one character
+        if len(text) <= max_tokens:
+            return text
+        tokens = self._encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return self._encoding.decode(tokens[:max_tokens])
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache hit and miss counts."""
+        if self._cache is None:
+            return {"hits": 0, "misses": 0}
+        return dict(self._cache.stats)
+
+    def close(self):
+        """
+        Flush the response cache to disk and close the OpenAI client.
+
+        Async clients are closed by the agenerate_all run that created them.
+        """
+        if self._cache is not None:
+            stats = self._cache.stats
+            logger.info(
+                f"Summary cache: {stats['hits']} hit(s), {stats['misses']} miss(es)"
+            )
+            self._cache.close()
+        if self.client is not None:
+            self.client.close()
+
+    def _cache_key(self, prompt: str) -> str:
+        """Hash the parameters that determine an AI response."""
+        payload = json.dumps(
+            {"m": self.model, "p": prompt, "t": self.max_tokens}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _cached_response(self, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (cache key, cached response) for a prompt; (None, None) if off."""
+        if self._cache is None:
+            return None, None
+        cache_key = self._cache_key(prompt)
+        return cache_key, self._cache.get(cache_key)
+
+    def _build_input_text(self, project_data: Dict[str, Any]) -> str:
+        """
+        Build the work details text (tickets and commits) for a project.
 
+        Ticket descriptions and commit messages are cut to 60 and 40 tokens
+        when tiktoken is installed (200 and 150 characters otherwise). The text
+        is capped at ``_MAX_INPUT_CHARS``; items that would not fit are left out.
+        """
         commit_messages = project_data.get("commit_messages", [])
         ticket_summaries = project_data.get("ticket_summaries", [])
         ticket_descriptions = project_data.get("ticket_descriptions", [])
 
-        # Build input text
-        all_text = []
+        buf = io.StringIO()
 
-        if ticket_summaries:
-            all_text.append("Jira Ticket Summaries:")
-            all_text.extend([f"- {s}" for s in ticket_summaries[:10]])
+        def emit(header: str, items: List[str]):
+            for index, item in enumerate(items):
+                chunk = f"- {item}"
+                if index == 0:
+                    chunk = f"{header}\n{chunk}"
+                    # Sections are separated by a blank line
+                    if buf.tell():
+                        chunk = f"\n{chunk}"
+                if buf.tell():
+                    chunk = f"\n{chunk}"
+                if buf.tell() + len(chunk) > _MAX_INPUT_CHARS:
+                    break
+                buf.write(chunk)
 
-        if ticket_descriptions:
-            all_text.append("\nJira Ticket Descriptions:")
-            all_text.extend([f"- {d[:200]}" for d in ticket_descriptions[:5]])
+        emit("Jira Ticket Summaries:", ticket_summaries[:10])
+        emit(
+            "Jira Ticket Descriptions:",
+            [self._truncate(d, 60, 200) for d in ticket_descriptions[:5]],
+        )
+        emit(
+            "Commit Messages:",
+            [self._truncate(m, 40, 150) for m in commit_messages[:20]],
+        )
 
-        if commit_messages:
-            all_text.append("\nCommit Messages:")
-            all_text.extend([f"- {m[:150]}" for m in commit_messages[:20]])
+        return buf.getvalue()
+
+    def _work_counts(self, project_data: Dict[str, Any]) -> Tuple[int, int]:
+        """Return the (commit, ticket) counts of a project."""
+        total_commits = project_data.get("metrics", {}).get(
+            "total_commits", len(project_data.get("commit_messages", []))
+        )
+        return total_commits, len(project_data.get("ticket_summaries", []))
+
+    def _is_sparse(self, project_data: Dict[str, Any], input_text: str) -> bool:
+        """Check whether a project has too little work for an AI summary."""
+        return len(input_text) < _MIN_AI_INPUT_CHARS or (
+            sum(self._work_counts(project_data)) < _MIN_AI_WORK_ITEMS
+        )
+
+    def _build_prompt(self, project_data: Dict[str, Any], input_text: str) -> str:
+        """Build the summary prompt for a project's work details text."""
+        # Build prompt with more context and examples
+        project_name = project_data.get("project_name", "Unknown")
+        total_commits, total_tickets = self._work_counts(project_data)
+
+        return (
+            f"{_PROMPT_INSTRUCTIONS}\n"
+            f"PROJECT: {project_name}\n"
+            f"STATISTICS: {total_commits} commits, {total_tickets} ticket(s)\n\n"
+            f"WORK DETAILS:\n{input_text}\n"
+        )
+
+    def _prepare_summary(
+        self, project_data: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+        """
+        Build the AI prompt for a project, or its summary if no request is needed.
+
+        Args:
+            project_data: Summary data for the project
 
-        input_text = "\n".join(all_text)
+        Returns:
+            (summary, None) when there is little or no work text or AI is
+            disabled, otherwise (None, prompt)
+        """
+        logger.info(f"Generating summary for project {project_data.get('project_key')}")
+
+        input_text = self._build_input_text(project_data)
 
         # If no text exists
         if not input_text.strip():
@@ -82,79 +435,521 @@ class TextProcessor:
                 "description": f"Work on {project_data.get('project_name', 'project')}",
                 "creative_work_details": "Various development tasks and improvements.",
                 "technical_summary": "No detailed information available.",
-            }
+            }, None
+
+        # A request would cost a round trip without adding much to a
+        # summary of one or two short items
+        if not self.use_ai or self._is_sparse(project_data, input_text):
+            return self._simple_summary(project_data), None
+
+        return None, self._build_prompt(project_data, input_text)
+
+    def _summary_from_content(
+        self, project_data: Dict[str, Any], content: Optional[str]
+    ) -> Dict[str, str]:
+        """Parse an AI response into a summary, raising if it is empty."""
+        if not content:
+            raise ValueError("Empty response from OpenAI API")
+
+        logger.debug(f"AI response received (length: {len(content)} chars)")
+        logger.debug(f"AI response preview: {content[:200]}...")
+
+        summary = self._parse_summary_response(content)
 
-        if not self.use_ai:
-            return self._generate_simple_summary(
-                project_data, commit_messages, ticket_summaries
+        # Log if we got generic fallback values
+        if (
+            summary.get("creative_work_details")
+            == "Various improvements and features were implemented."
+        ):
+            project_name = project_data.get("project_name", "Unknown")
+            logger.warning(
+                f"Received generic summary for {project_name}. Raw response: {content[:500]}"
             )
 
-        # Build prompt with more context and examples
-        project_name = project_data.get("project_name", "Unknown")
-        metrics = project_data.get("metrics", {})
-        total_commits = metrics.get("total_commits", len(commit_messages))
-        total_tickets = len(ticket_summaries)
+        return summary
 
-        prompt = f"""You are a technical writer creating professional summaries of software development work for a Creative Work Report.
+    def _fallback_summary(
+        self, project_data: Dict[str, Any], error: Exception
+    ) -> Dict[str, str]:
+        """Log a failed AI request and summarize without AI instead."""
+        if isinstance(error, RateLimitError):
+            logger.error(f"AI request rate limited (fallback used): {error}")
+        else:
+            logger.error(f"AI request failed (fallback used): {error}")
+        return self._simple_summary(project_data)
 
-PROJECT: {project_name}
-STATISTICS: {total_commits} commits, {total_tickets} ticket(s)
+    def _simple_summary(self, project_data: Dict[str, Any]) -> Dict[str, str]:
+        """Summarize a project without AI."""
+        return self._generate_simple_summary(
+            project_data,
+            project_data.get("commit_messages", []),
+            project_data.get("ticket_summaries", []),
+        )
 
-WORK DETAILS:
-{input_text}
+    def generate_project_summary(self, project_data: Dict[str, Any]) -> Dict[str, str]:
+        """Generate creative work summary for a project."""
+        summary, prompt = self._prepare_summary(project_data)
+        if summary is not None:
+            return summary
 
-TASK: Analyze the work above and create a professional summary with three sections:
+        cache_key, content = self._cached_response(prompt)
+        if content is not None:
+            return self._summary_from_content(project_data, content)
 
-1. DESCRIPTION: Write a concise, business-friendly description of what this project/work is about (1-2 sentences). Focus on the purpose and value of the work.
+        try:
+            content, stopped_early = self._with_retries(
+                lambda: self._stream_response(prompt)
+            )
+            summary = self._summary_from_content(project_data, content)
+        except Exception as e:
+            return self._fallback_summary(project_data, e)
 
-2. DETAILS: Describe the specific creative work accomplished (2-4 sentences). Be specific about features, improvements, fixes, or enhancements. Reference specific tickets or commits when relevant. Avoid generic phrases like "various improvements" - be concrete.
+        if cache_key is not None and not stopped_early:
+            self._cache.set(cache_key, content)
+        return summary
 
-3. TECHNICAL: Provide a brief technical summary for internal tracking (1-2 sentences). Mention key technologies, patterns, or technical achievements.
+    def _retry_delay(
+        self, error: Exception, attempt: int, rate_limiter: Optional[RateLimiter]
+    ) -> Optional[float]:
+        """
+        Get seconds to wait before retrying a failed AI request.
 
-IMPORTANT FORMATTING REQUIREMENTS:
-- Start each section with exactly: "DESCRIPTION:", "DETAILS:", or "TECHNICAL:" (all caps, followed by colon)
-- Write the content on the same line or following lines
-- Be specific and concrete - avoid generic phrases
-- Use professional, business-friendly language
+        Args:
+            error: Retryable error raised by the request
+            attempt: Zero-based number of the failed attempt
+            rate_limiter: Limiter to slow down when throttled, if any
 
-Example format:
-DESCRIPTION: [Your description here]
-DETAILS: [Your details here]
-TECHNICAL: [Your technical summary here]
-"""
+        Returns:
+            Delay in seconds, or None when no attempts are left
+        """
+        if isinstance(error, RateLimitError) and rate_limiter:
+            rate_limiter.on_throttled()
+        if attempt >= self.max_retries:
+            return None
+        response = getattr(error, "response", None)
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        delay = get_backoff_delay(attempt, retry_after)
+        logger.warning(
+            f"AI request failed ({error}). Retrying in {delay:.1f} seconds..."
+        )
+        return delay
+
+    def _with_retries(self, request: Callable[[], T], rate_limited: bool = True) -> T:
+        """
+        Run an AI request under the rate limiter, retrying transient errors.
+
+        Args:
+            request: Function sending the request
+            rate_limited: Whether the request counts against the rate limiter
+                (False for Batch API file and status calls)
+
+        Returns:
+            Result of the first successful attempt
+        """
+        rate_limiter = self.rate_limiter if rate_limited else None
+        for attempt in range(self.max_retries + 1):
+            if rate_limiter:
+                rate_limiter.acquire()
+            try:
+                result = request()
+            except _RETRYABLE_ERRORS as e:
+                delay = self._retry_delay(e, attempt, rate_limiter)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                if rate_limiter:
+                    rate_limiter.on_success()
+                return result
+
+    async def _awith_retries(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Asynchronous version of ``_with_retries``; waits without blocking."""
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+            try:
+                result = await request()
+            except _RETRYABLE_ERRORS as e:
+                delay = self._retry_delay(e, attempt, self.rate_limiter)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                if self.rate_limiter:
+                    self.rate_limiter.on_success()
+                return result
+
+    def _stream_response(self, prompt: str) -> Tuple[str, bool]:
+        """
+        Stream the response to a summary prompt, stopping once it is complete.
+
+        Args:
+            prompt: Summary prompt for a single project
+
+        Returns:
+            (response text received so far, whether the stream was stopped early)
+        """
+        parts = []
+        with self.client.responses.stream(
+            model=self.model,
+            input=prompt,
+            max_output_tokens=self.max_tokens,
+        ) as stream:
+            for event in stream:
+                if event.type != "response.output_text.delta":
+                    continue
+                parts.append(event.delta)
+                # Sections only end on a line break
+                if "\n" in event.delta and _summary_complete("".join(parts)):
+                    return "".join(parts), True
+        return "".join(parts), False
+
+    def _new_async_client(self) -> AsyncOpenAI:
+        """
+        Create an async OpenAI client for one event loop.
+
+        Pooled connections belong to the loop that opened them, so each
+        agenerate_all run uses, and closes, its own client.
+        """
+        return AsyncOpenAI(
+            api_key=self._api_key,
+            max_retries=0,
+            timeout=30,
+            http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE),
+        )
+
+    async def _astream_response(
+        self, prompt: str, aclient: AsyncOpenAI
+    ) -> Tuple[str, bool]:
+        """Asynchronous version of ``_stream_response``."""
+        parts = []
+        async with aclient.responses.stream(
+            model=self.model,
+            input=prompt,
+            max_output_tokens=self.max_tokens,
+        ) as stream:
+            async for event in stream:
+                if event.type != "response.output_text.delta":
+                    continue
+                parts.append(event.delta)
+                if "\n" in event.delta and _summary_complete("".join(parts)):
+                    return "".join(parts), True
+        return "".join(parts), False
+
+    async def _agenerate_one(
+        self, project_data: Dict[str, Any], aclient: Optional[AsyncOpenAI]
+    ) -> Dict[str, str]:
+        """Generate a project summary without blocking the event loop."""
+        summary, prompt = self._prepare_summary(project_data)
+        if summary is not None:
+            return summary
+
+        cache_key, content = self._cached_response(prompt)
+        if content is not None:
+            return self._summary_from_content(project_data, content)
 
         try:
-            response = self.client.responses.create(
-                model=self.model,
-                input=prompt,
-                max_output_tokens=self.max_tokens,
+            content, stopped_early = await self._awith_retries(
+                lambda: self._astream_response(prompt, aclient)
             )
+            summary = self._summary_from_content(project_data, content)
+        except Exception as e:
+            return self._fallback_summary(project_data, e)
 
-            content = response.output_text
-            if not content:
-                raise ValueError("Empty response from OpenAI API")
+        if cache_key is not None and not stopped_early:
+            self._cache.set(cache_key, content)
+        return summary
 
-            logger.debug(f"AI response received (length: {len(content)} chars)")
-            logger.debug(f"AI response preview: {content[:200]}...")
+    async def agenerate_all(
+        self, projects_data: List[Dict[str, Any]], concurrency: int = 8
+    ) -> List[Dict[str, str]]:
+        """
+        Generate summaries for several projects with concurrent AI requests.
 
-            summary = self._parse_summary_response(content)
+        Args:
+            projects_data: Summary data for each project
+            concurrency: Maximum number of requests in flight
 
-            # Log if we got generic fallback values
-            if (
-                summary.get("creative_work_details")
-                == "Various improvements and features were implemented."
-            ):
-                logger.warning(
-                    f"Received generic summary for {project_name}. Raw response: {content[:500]}"
+        Returns:
+            Summaries in the same order as ``projects_data``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        aclient = self._new_async_client() if self.use_ai else None
+
+        async def bounded(project_data: Dict[str, Any]) -> Dict[str, str]:
+            async with semaphore:
+                return await self._agenerate_one(project_data, aclient)
+
+        try:
+            return await asyncio.gather(*(bounded(p) for p in projects_data))
+        finally:
+            if aclient is not None:
+                await aclient.close()
+
+    def generate_all(
+        self, projects_data: List[Dict[str, Any]], concurrency: int = 8
+    ) -> List[Dict[str, str]]:
+        """
+        Generate summaries for several projects concurrently (blocking).
+
+        Args:
+            projects_data: Summary data for each project
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Summaries in the same order as ``projects_data``
+        """
+        return asyncio.run(self.agenerate_all(projects_data, concurrency))
+
+    def generate_project_summaries_via_batch(
+        self,
+        projects_data: List[Dict[str, Any]],
+        poll_interval: float = 30.0,
+    ) -> List[Dict[str, str]]:
+        """
+        Generate summaries through the OpenAI Batch API.
+
+        Batch requests cost half as much and use a separate rate limit pool,
+        but may take up to 24 hours, so this suits large unattended runs.
+        Projects without a usable batch result fall back to individual
+        requests.
+
+        Args:
+            projects_data: Summary data for each project
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Summaries in the same order as ``projects_data``
+        """
+        summaries: List[Optional[Dict[str, str]]] = [None] * len(projects_data)
+        requests = {}
+        for idx, project_data in enumerate(projects_data):
+            summary, prompt = self._prepare_summary(project_data)
+            if summary is None:
+                cache_key, content = self._cached_response(prompt)
+                if content is not None:
+                    summary = self._summary_from_content(project_data, content)
+                else:
+                    requests[f"project-{idx}"] = (idx, prompt, cache_key)
+            summaries[idx] = summary
+
+        if requests:
+            prompts = {
+                custom_id: prompt for custom_id, (_, prompt, _) in requests.items()
+            }
+            contents = self._run_batch(prompts, poll_interval)
+            for custom_id, (idx, _, cache_key) in requests.items():
+                content = contents.get(custom_id)
+                if not content:
+                    summaries[idx] = self.generate_project_summary(projects_data[idx])
+                    continue
+                summaries[idx] = self._summary_from_content(
+                    projects_data[idx], content
                 )
+                if cache_key is not None:
+                    self._cache.set(cache_key, content)
 
-            return summary
+        return summaries
+
+    def _run_batch(
+        self, prompts: Dict[str, str], poll_interval: float
+    ) -> Dict[str, str]:
+        """
+        Run prompts as one Batch API job and wait for it to finish.
+
+        Args:
+            prompts: Prompts keyed by request id
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Response text keyed by request id; failed requests are omitted
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/responses",
+                    "body": {
+                        "model": self.model,
+                        "input": prompt,
+                        "max_output_tokens": self.max_tokens,
+                    },
+                }
+            )
+            for custom_id, prompt in prompts.items()
+        ]
+
+        def call(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+            # Transient errors must not abandon a batch that is still running
+            return self._with_retries(lambda: func(*args, **kwargs), rate_limited=False)
 
+        try:
+            input_file = call(
+                self.client.files.create,
+                file=("summaries.jsonl", "\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = call(
+                self.client.batches.create,
+                input_file_id=input_file.id,
+                endpoint="/v1/responses",
+                completion_window="24h",
+            )
+            logger.info(f"Submitted batch {batch.id} with {len(prompts)} requests")
+
+            while batch.status not in _BATCH_FINAL_STATUSES:
+                time.sleep(poll_interval)
+                batch = call(self.client.batches.retrieve, batch.id)
+                logger.debug(f"Batch {batch.id} status: {batch.status}")
+
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"Batch {batch.id} ended with status {batch.status}")
+                return {}
+            output = call(self.client.files.content, batch.output_file_id).text
         except Exception as e:
-            logger.error(f"AI request failed (fallback used): {e}")
-            return self._generate_simple_summary(
-                project_data, commit_messages, ticket_summaries
+            logger.error(f"Batch request failed: {e}")
+            return {}
+
+        contents = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                result = json.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    contents[result["custom_id"]] = _response_output_text(
+                        response.get("body") or {}
+                    )
+            except (json.JSONDecodeError, KeyError, AttributeError) as e:
+                # Projects of a bad line fall back to individual requests
+                logger.error(f"Skipping malformed batch output line: {e}")
+        return contents
+
+    def generate_project_summaries_batched(
+        self, projects_data: List[Dict[str, Any]], batch_size: int = 8
+    ) -> List[Dict[str, str]]:
+        """
+        Generate summaries for several projects, packing up to ``batch_size``
+        projects into each AI request.
+
+        Projects that don't need AI (little or no work text, or AI disabled)
+        are summarized locally. Projects missing from a batched response, or in a
+        batch whose request failed, fall back to individual requests.
+
+        Args:
+            projects_data: Summary data for each project
+            batch_size: Maximum number of projects per request
+
+        Returns:
+            Summaries in the same order as ``projects_data``
+        """
+        summaries: List[Optional[Dict[str, str]]] = [None] * len(projects_data)
+        pending = []
+        for idx, project_data in enumerate(projects_data):
+            input_text = self._build_input_text(project_data)
+            if self.use_ai and not self._is_sparse(project_data, input_text):
+                pending.append((idx, input_text))
+            else:
+                summaries[idx] = self.generate_project_summary(project_data)
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            batch_summaries = self._generate_batch(
+                [(projects_data[idx], input_text) for idx, input_text in batch]
+            )
+            for (idx, _), summary in zip(batch, batch_summaries):
+                if summary is None:
+                    summary = self.generate_project_summary(projects_data[idx])
+                summaries[idx] = summary
+
+        return summaries
+
+    def _generate_batch(
+        self, batch: List[Tuple[Dict[str, Any], str]]
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Summarize several projects with a single AI request.
+
+        Args:
+            batch: (project data, work details text) pairs
+
+        Returns:
+            Summary for each project, or None where the response lacks one
+        """
+        project_sections = []
+        for number, (project_data, input_text) in enumerate(batch, 1):
+            total_commits, total_tickets = self._work_counts(project_data)
+            project_name = project_data.get("project_name", "Unknown")
+            project_sections.append(
+                f"=== PROJECT {number}: {project_name} ===\n"
+                f"STATISTICS: {total_commits} commits, {total_tickets} ticket(s)\n\n"
+                f"WORK DETAILS:\n{input_text}\n"
+            )
+        projects_text = "\n".join(project_sections)
+
+        prompt = (
+            f"{_BATCH_PROMPT_INSTRUCTIONS}\n"
+            f'Below are {len(batch)} projects, each introduced by a line "=== PROJECT <n>: <name> ===".\n\n'
+            f"{projects_text}"
+        )
+
+        logger.info(f"Generating batched summary for {len(batch)} projects")
+        cache_key, content = self._cached_response(prompt)
+        if content is None:
+            try:
+                response = self._with_retries(
+                    lambda: self.client.responses.create(
+                        model=self.model,
+                        input=prompt,
+                        max_output_tokens=self.max_tokens * len(batch),
+                    )
+                )
+                content = response.output_text
+                if not content:
+                    raise ValueError("Empty response from OpenAI API")
+            except RateLimitError as e:
+                logger.error(f"Batched AI request rate limited: {e}")
+                return [None] * len(batch)
+            except Exception as e:
+                logger.error(f"Batched AI request failed: {e}")
+                return [None] * len(batch)
+            if cache_key is not None:
+                self._cache.set(cache_key, content)
+
+        sections = self._split_batch_response(content)
+        summaries = []
+        for number in range(1, len(batch) + 1):
+            if number in sections:
+                summaries.append(self._parse_summary_response(sections[number]))
+            else:
+                logger.warning(f"Batched response has no summary for project {number}")
+                summaries.append(None)
+        return summaries
+
+    def _split_batch_response(self, content: str) -> Dict[int, str]:
+        """
+        Split a batched AI response into per-project responses.
+
+        Args:
+            content: Response with "PROJECT <n> <SECTION>:" headers
+
+        Returns:
+            Dictionary mapping project numbers to "SECTION: text" lines that
+            _parse_summary_response understands
+        """
+        sections: Dict[int, List[str]] = {}
+        matches = list(_BATCH_SECTION_RE.finditer(content))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(content)
+            text = content[match.end() : end].strip()
+            sections.setdefault(int(match.group(1)), []).append(
+                f"{match.group(2).upper()}: {text}"
             )
+        return {number: "\n".join(parts) for number, parts in sections.items()}
 
     def _generate_simple_summary(self, project_data, commit_messages, ticket_summaries):
         """Fallback summary generator (non-AI)."""
@@ -171,24 +966,14 @@ TECHNICAL: [Your technical summary here]
         details_parts = []
 
         if ticket_summaries:
+            top_tickets = ", ".join(ticket_summaries[:3])
             details_parts.append(
-                f"Completed {len(ticket_summaries)} ticket(s) including: {', '.join(ticket_summaries[:3])}"
+                f"Completed {len(ticket_summaries)} ticket(s) including: {top_tickets}"
             )
 
         if commit_messages:
-            commit_types = {}
-            for msg in commit_messages[:20]:
-                msg_lower = msg.lower()
-                if msg_lower.startswith("feat") or "feature" in msg_lower:
-                    commit_types["features"] = commit_types.get("features", 0) + 1
-                elif msg_lower.startswith("fix") or "bug" in msg_lower:
-                    commit_types["fixes"] = commit_types.get("fixes", 0) + 1
-                elif msg_lower.startswith("refactor"):
-                    commit_types["refactoring"] = commit_types.get("refactoring", 0) + 1
-                else:
-                    commit_types["improvements"] = (
-                        commit_types.get("improvements", 0) + 1
-                    )
+            # Counter keeps first-seen order, which the description follows
+            commit_types = Counter(map(_classify_commit, commit_messages[:20]))
 
             if commit_types:
                 type_desc = ", ".join(
@@ -222,103 +1007,29 @@ TECHNICAL: [Your technical summary here]
     def _parse_summary_response(self, content: str) -> Dict[str, str]:
         """Parse AI output into structured fields with improved robustness."""
 
-        description = ""
-        details = ""
-        technical = ""
-
         # Normalize content - remove markdown code blocks if present
         content = content.strip()
         if content.startswith("```"):
             # Remove markdown code blocks
-            lines = content.split("\n")
-            content = "\n".join([l for l in lines if not l.strip().startswith("```")])
-
-        lines = content.split("\n")
-        current = None
-        buff = []
-
-        def flush(section, buf):
-            text = " ".join(buf).strip()
-            if section == "description":
-                return text, None, None
-            if section == "details":
-                return None, text, None
-            if section == "technical":
-                return None, None, text
-            return None, None, None
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip empty lines
-            if not stripped:
-                continue
-
-            # Check for section headers (case-insensitive, with or without colon)
-            line_upper = stripped.upper()
-
-            if line_upper.startswith("DESCRIPTION"):
-                if current and buff:
-                    d, dt, t = flush(current, buff)
-                    if d:
-                        description = d
-                    if dt:
-                        details = dt
-                    if t:
-                        technical = t
-                current = "description"
-                # Extract text after "DESCRIPTION:" or "DESCRIPTION"
-                if ":" in stripped:
-                    buff = [stripped.split(":", 1)[1].strip()]
-                else:
-                    buff = []
-                continue
-
-            if line_upper.startswith("DETAILS"):
-                if current and buff:
-                    d, dt, t = flush(current, buff)
-                    if d:
-                        description = d
-                    if dt:
-                        details = dt
-                    if t:
-                        technical = t
-                current = "details"
-                if ":" in stripped:
-                    buff = [stripped.split(":", 1)[1].strip()]
-                else:
-                    buff = []
-                continue
-
-            if line_upper.startswith("TECHNICAL"):
-                if current and buff:
-                    d, dt, t = flush(current, buff)
-                    if d:
-                        description = d
-                    if dt:
-                        details = dt
-                    if t:
-                        technical = t
-                current = "technical"
-                if ":" in stripped:
-                    buff = [stripped.split(":", 1)[1].strip()]
-                else:
-                    buff = []
-                continue
+            content = _FENCE_RE.sub("", content)
 
-            # If we're in a section, add the line to the buffer
-            if current:
-                buff.append(stripped)
+        # Each header line starts a section that runs until the next header;
+        # later non-empty sections of the same kind win
+        sections = {}
+        matches = list(_SECTION_RE.finditer(content))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(content)
+            # Text on the header line counts only after a colon
+            header_rest = match.group(2)
+            parts = [header_rest.partition(":")[2]] if ":" in header_rest else []
+            parts.extend(content[match.end() : end].split("\n"))
+            text = " ".join(filter(None, map(str.strip, parts)))
+            if text:
+                sections[match.group(1).lower()] = text
 
-        # Flush the last section
-        if current and buff:
-            d, dt, t = flush(current, buff)
-            if d:
-                description = d
-            if dt:
-                details = dt
-            if t:
-                technical = t
+        description = sections.get("description", "")
+        details = sections.get("details", "")
+        technical = sections.get("technical", "")
 
         # If parsing failed, try to extract from unstructured text
         if not description and not details and not technical:
@@ -329,7 +1040,9 @@ TECHNICAL: [Your technical summary here]
             all_text = content.strip()
             if len(all_text) > 50:  # If there's substantial content
                 # Split by paragraphs and try to assign
-                paragraphs = [p.strip() for p in all_text.split("\n\n") if p.strip()]
+                paragraphs = [
+                    p.strip() for p in _PARAGRAPH_RE.split(all_text) if p.strip()
+                ]
                 if paragraphs:
                     description = paragraphs[0][:200] if len(paragraphs) >= 1 else ""
                     details = (
@@ -356,4 +1069,5 @@ TECHNICAL: [Your technical summary here]
         """Normalize whitespace."""
         if not text:
             return ""
-        return " ".join(text.split()).strip()
+        # split() already drops leading and trailing whitespace
+        return " ".join(text.split())
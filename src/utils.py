@@ -1,12 +1,43 @@
 """Utility functions for the Creative Work Report Generator"""
 
+import asyncio
+import copy
 import os
+import random
+import threading
+import time
 import yaml
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
+try:
+    # libyaml C loader, when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# (environment variable, config section, config key) overrides
+_ENV_OVERRIDES = (
+    ("GITHUB_TOKEN", "github", "token"),
+    ("JIRA_URL", "jira", "url"),
+    ("JIRA_EMAIL", "jira", "email"),
+    ("JIRA_API_TOKEN", "jira", "api_token"),
+    ("OPENAI_API_KEY", "openai", "api_key"),
+    ("COMPANY_NAME", "report", "company_name"),
+)
+
+
+@lru_cache(maxsize=4)
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file once; callers must copy the result."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from YAML file and environment variables."""
@@ -21,38 +52,106 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     if config_path is None:
         config_path = Path(__file__).parent.parent / "config" / "config.yaml"
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    # The file is parsed once per path; each caller gets its own copy
+    config = copy.deepcopy(_read_config_file(str(config_path)))
     
     # Override with environment variables
-    if os.getenv("GITHUB_TOKEN"):
-        config["github"]["token"] = os.getenv("GITHUB_TOKEN")
-    
-    if os.getenv("JIRA_URL"):
-        config["jira"]["url"] = os.getenv("JIRA_URL")
-    if os.getenv("JIRA_EMAIL"):
-        config["jira"]["email"] = os.getenv("JIRA_EMAIL")
-    if os.getenv("JIRA_API_TOKEN"):
-        config["jira"]["api_token"] = os.getenv("JIRA_API_TOKEN")
-    
-    if os.getenv("OPENAI_API_KEY"):
-        config["openai"]["api_key"] = os.getenv("OPENAI_API_KEY")
-    
-    if os.getenv("COMPANY_NAME"):
-        config["report"]["company_name"] = os.getenv("COMPANY_NAME")
+    for env_var, section, key in _ENV_OVERRIDES:
+        value = os.environ.get(env_var)
+        if value:
+            config[section][key] = value
     
     # Handle GitHub organization/repository filters from environment
-    if os.getenv("GITHUB_ORGANIZATIONS"):
-        orgs = [org.strip() for org in os.getenv("GITHUB_ORGANIZATIONS").split(",") if org.strip()]
-        config["github"]["organizations"] = orgs
+    orgs = os.environ.get("GITHUB_ORGANIZATIONS")
+    if orgs:
+        config["github"]["organizations"] = [
+            org.strip() for org in orgs.split(",") if org.strip()
+        ]
     
-    if os.getenv("GITHUB_REPOSITORIES"):
-        repos = [repo.strip() for repo in os.getenv("GITHUB_REPOSITORIES").split(",") if repo.strip()]
-        config["github"]["repositories"] = repos
+    repos = os.environ.get("GITHUB_REPOSITORIES")
+    if repos:
+        config["github"]["repositories"] = [
+            repo.strip() for repo in repos.split(",") if repo.strip()
+        ]
     
     return config
 
 
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Typed, read-only application settings.
+
+    Built once from the merged config file, environment and CLI values so the
+    rest of the program never reads or mutates the raw configuration dict.
+    """
+
+    github_token: Optional[str] = None
+    github_max_retries: int = 3
+    github_max_workers: int = 8
+    organizations: Tuple[str, ...] = ()
+    repositories: Tuple[str, ...] = ()
+    jira_url: Optional[str] = None
+    jira_email: Optional[str] = None
+    jira_api_token: Optional[str] = None
+    jira_max_retries: int = 3
+    jira_max_workers: int = 8
+    openai_api_key: Optional[str] = None
+    openai_model: str = "gpt-5"
+    openai_max_tokens: int = 50000
+    openai_max_concurrency: int = 4
+    openai_max_retries: int = 5
+    openai_requests_per_minute: Optional[float] = None
+    openai_use_batch_api: bool = False
+    summary_cache_path: Optional[str] = None
+    company_name: str = ""
+    default_year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, cfg: Dict[str, Any], **overrides: Any) -> "AppConfig":
+        """
+        Build settings from a configuration dictionary.
+
+        Args:
+            cfg: Configuration dictionary (as returned by load_config)
+            **overrides: Field values taking precedence over cfg, e.g. CLI
+                options; empty values are ignored
+
+        Returns:
+            AppConfig instance
+        """
+        github = cfg.get("github") or {}
+        jira = cfg.get("jira") or {}
+        openai = cfg.get("openai") or {}
+        report = cfg.get("report") or {}
+
+        values = {
+            "github_token": github.get("token"),
+            "github_max_retries": github.get("max_retries", 3),
+            "github_max_workers": github.get("max_workers", 8),
+            "organizations": tuple(github.get("organizations") or ()),
+            "repositories": tuple(github.get("repositories") or ()),
+            "jira_url": jira.get("url"),
+            "jira_email": jira.get("email"),
+            "jira_api_token": jira.get("api_token"),
+            "jira_max_retries": jira.get("max_retries", 3),
+            "jira_max_workers": jira.get("max_workers", 8),
+            "openai_api_key": openai.get("api_key"),
+            "openai_model": openai.get("model", "gpt-5"),
+            "openai_max_tokens": openai.get("max_tokens", 50000),
+            "openai_max_concurrency": openai.get("max_concurrency", 4),
+            "openai_max_retries": openai.get("max_retries", 5),
+            "openai_requests_per_minute": openai.get("requests_per_minute"),
+            "openai_use_batch_api": bool(openai.get("use_batch_api", False)),
+            "summary_cache_path": openai.get("cache_path"),
+            "company_name": report.get("company_name") or "",
+            "default_year": report.get("default_year"),
+        }
+        for name, value in overrides.items():
+            if value:
+                values[name] = value
+        return cls(**values)
+
+
 def setup_logging(level: str = "INFO", format_string: Optional[str] = None):
     """Set up logging configuration."""
     if format_string is None:
@@ -65,6 +164,97 @@ def setup_logging(level: str = "INFO", format_string: Optional[str] = None):
     )
 
 
+def get_backoff_delay(
+    attempt: int,
+    retry_after: Optional[str] = None,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    max_retry_after: float = 600.0,
+) -> float:
+    """Get seconds to wait before retrying a rate-limited request.
+
+    Honors a Retry-After header (in seconds) when the server sends one, even
+    beyond ``max_delay``, since retrying earlier only earns another 429;
+    ``max_retry_after`` only guards against absurd values. Otherwise uses
+    capped exponential backoff (1, 2, 4, ... seconds) with jitter so that
+    concurrent callers don't retry in lockstep.
+    """
+    if retry_after:
+        try:
+            return min(max_retry_after, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+
+    delay = min(max_delay, base_delay * (2**attempt))
+    return delay * (0.5 + random.random() * 0.5)
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting requests per minute.
+
+    Callers only wait when the bucket is empty, so requests run at the full
+    allowed rate instead of a fixed worst-case pace. The refill rate adapts
+    AIMD-style: it halves whenever the server throttles a request and
+    recovers additively towards the configured rate on successes.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: Optional[float] = None,
+        min_requests_per_minute: float = 1.0,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum sustained request rate
+            burst: Bucket capacity (default: one second's worth, at least 1)
+            min_requests_per_minute: Floor for the rate after repeated throttling
+        """
+        self.max_rate = requests_per_minute / 60.0
+        self.min_rate = min(self.max_rate, min_requests_per_minute / 60.0)
+        self.rate = self.max_rate
+        self.capacity = burst if burst is not None else max(1.0, self.max_rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the token up front; waiting callers queue up behind it
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Take a token, yielding to the event loop until one is available."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_throttled(self):
+        """Halve the request rate after the server throttled a request."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self):
+        """Recover a tenth of the configured rate after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
 def get_year_range(year: int) -> tuple[datetime, datetime]:
     """Get start and end datetime for a given year."""
     start = datetime(year, 1, 1, 0, 0, 0)
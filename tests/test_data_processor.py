@@ -98,6 +98,39 @@ class TestDataProcessor(unittest.TestCase):
         self.assertIn(unlinked_key, projects)
         self.assertEqual(projects[unlinked_key]["metrics"]["total_commits"], 1)
 
+    def test_group_by_project_merges_unlinked_into_repo_project(self):
+        """Test that unlinked commits join the project using the same repository."""
+        commits = [
+            {"sha": "abc123", "message": "fix: bug FUI-0", "repository": "test/repo"},
+            {"sha": "def456", "message": "chore: tidy up", "repository": "test/repo"},
+            {"sha": "fed789", "message": "chore: other", "repository": "test/other"},
+        ]
+        tickets = {
+            "FUI-0": {"key": "FUI-0", "project_name": "Feature UI", "summary": "Fix"}
+        }
+
+        linked_commits = self.processor.link_commits_to_tickets(commits, tickets)
+        projects = self.processor.group_by_project(linked_commits)
+
+        self.assertEqual(set(projects), {"FUI", "UNLINKED-test/other"})
+        self.assertEqual(projects["FUI"]["metrics"]["total_commits"], 2)
+
+    def test_link_commits_parses_duplicate_messages_once(self):
+        """Test that identical commit messages are only parsed once."""
+        self.jira_client.extract_ticket_keys = Mock(
+            side_effect=JiraClient.extract_ticket_keys
+        )
+        commits = [
+            {"sha": "abc123", "message": "Merge FUI-1 FUI-0", "repository": "test/repo"},
+            {"sha": "def456", "message": "Merge FUI-1 FUI-0", "repository": "test/repo"},
+        ]
+
+        linked_commits = self.processor.link_commits_to_tickets(commits, {})
+
+        self.jira_client.extract_ticket_keys.assert_called_once()
+        self.assertEqual(linked_commits[0]["ticket_keys"], ["FUI-0", "FUI-1"])
+        self.assertEqual(linked_commits[1]["ticket_keys"], ["FUI-0", "FUI-1"])
+
     def test_deduplicate_commits(self):
         """Test deduplication of commits."""
         commits = [
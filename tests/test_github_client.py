@@ -0,0 +1,114 @@
+"""Tests for GitHub repository filtering and commit fetching."""
+
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+from src.github_client import GitHubClient
+
+
+def make_repo(full_name, private=False, commits=()):
+    """Build a minimal stand-in for a PyGithub repository."""
+    repo = Mock(full_name=full_name, private=private)
+    repo.get_commits.return_value = list(commits)
+    return repo
+
+
+def make_commit(sha, date, message="fix: bug"):
+    """Build a minimal stand-in for a PyGithub commit."""
+    commit = Mock(sha=sha, html_url=f"https://github.com/c/{sha}")
+    commit.commit.message = message
+    commit.commit.author.name = "Me"
+    commit.commit.author.date = date
+    return commit
+
+
+class TestGitHubClient(unittest.TestCase):
+    """Test GitHub client."""
+
+    def setUp(self):
+        """Set up a client with a mocked GitHub connection."""
+        with patch("src.github_client.Github"):
+            self.client = GitHubClient("token")
+        self.client._user = Mock(login="Me")
+        self.client._user.get_repos.return_value = [
+            make_repo("MyOrg/api"),
+            make_repo("myorg/Web"),
+            make_repo("other/api"),
+            make_repo("me/dotfiles"),
+        ]
+
+    def full_names(self, repos):
+        return [repo.full_name for repo in repos]
+
+    def test_filter_by_organization_case_insensitive(self):
+        """Test filtering repositories by organization."""
+        repos = self.client.get_user_repositories(organizations=["myorg"])
+        self.assertEqual(self.full_names(repos), ["MyOrg/api", "myorg/Web"])
+
+    def test_filter_by_repository_formats(self):
+        """Test filtering by "org/repo" and bare "repo" names."""
+        repos = self.client.get_user_repositories(
+            repositories=["OTHER/api", "web"]
+        )
+        self.assertEqual(self.full_names(repos), ["myorg/Web", "other/api"])
+
+    def test_repositories_take_precedence(self):
+        """Test that repository filters take precedence over organizations."""
+        repos = self.client.get_user_repositories(
+            organizations=["myorg"], repositories=["dotfiles"]
+        )
+        self.assertEqual(self.full_names(repos), ["me/dotfiles"])
+
+    def test_no_filters_returns_all(self):
+        """Test that no filters returns every repository."""
+        repos = self.client.get_user_repositories()
+        self.assertEqual(len(repos), 4)
+
+    def test_get_commits_for_year(self):
+        """Test fetching commits across repositories for a single year."""
+        self.client._user.get_repos.return_value = [
+            make_repo(
+                "myorg/api",
+                commits=[
+                    make_commit("a2", datetime(2025, 1, 3, tzinfo=timezone.utc)),
+                    make_commit("a1", datetime(2024, 5, 1, tzinfo=timezone.utc)),
+                    make_commit("a0", datetime(2023, 12, 31, tzinfo=timezone.utc)),
+                ],
+            ),
+            make_repo(
+                "myorg/web",
+                private=True,
+                commits=[
+                    make_commit("b1", datetime(2024, 1, 2)),
+                    Mock(sha="b0", commit=Mock(author=None)),
+                ],
+            ),
+            make_repo("myorg/empty"),
+        ]
+
+        commits = self.client.get_commits_for_year(2024)
+
+        self.assertEqual([c["sha"] for c in commits], ["a1", "b1"])
+        self.assertEqual(commits[1]["repository"], "myorg/web")
+        self.assertEqual(commits[1]["date"].tzinfo, timezone.utc)
+        api_repo = self.client._user.get_repos.return_value[0]
+        api_repo.get_commits.assert_called_once_with(
+            author="Me", since=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+    def test_commit_committed_after_year_end_is_kept(self):
+        """Test that a commit rebased into the next year keeps its author year."""
+        commit = make_commit("c1", datetime(2024, 12, 28, tzinfo=timezone.utc))
+        # Rebased in January: the committer date is in the next year
+        commit.commit.committer.date = datetime(2025, 1, 8, tzinfo=timezone.utc)
+        repo = make_repo("myorg/api", commits=[commit])
+        self.client._user.get_repos.return_value = [repo]
+
+        commits = self.client.get_commits_for_year(2024)
+
+        self.assertEqual([c["sha"] for c in commits], ["c1"])
+        self.assertNotIn("until", repo.get_commits.call_args.kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 """Tests for Jira ticket extraction."""
 
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+from jira.exceptions import JIRAError
 from src.jira_client import JiraClient
 
 
@@ -31,6 +35,18 @@ class TestJiraClient(unittest.TestCase):
         keys = JiraClient.extract_ticket_keys(text)
         self.assertEqual(keys, {"FUI-0", "PROJ-123"})
 
+    def test_extract_ticket_keys_after_non_ascii_word(self):
+        """Test extracting a key that follows a word with diacritics."""
+        text = "naïve PROJ-1"
+        keys = JiraClient.extract_ticket_keys(text)
+        self.assertEqual(keys, {"PROJ-1"})
+
+    def test_extract_ticket_keys_ignores_tails_of_non_ascii_words(self):
+        """Test that words with diacritics are not read as ticket keys."""
+        for text in ("poprawka błędu-3", "wyłączenie-2 modułu", "naïve-12"):
+            with self.subTest(text=text):
+                self.assertEqual(JiraClient.extract_ticket_keys(text), set())
+
     def test_extract_ticket_keys_no_match(self):
         """Test with no ticket keys."""
         text = "fix: bug in something"
@@ -42,11 +58,184 @@ class TestJiraClient(unittest.TestCase):
         keys = JiraClient.extract_ticket_keys("")
         self.assertEqual(keys, set())
 
+    def test_extract_tickets_from_commits(self):
+        """Test extracting unique keys across commits."""
+        commits = [
+            {"message": "fix: fui-0 and PROJ-123"},
+            {"message": "feat: FUI-0 again"},
+            {"message": None},
+            {},
+        ]
+        keys = JiraClient.extract_tickets_from_commits(Mock(), commits)
+        self.assertEqual(keys, {"FUI-0", "PROJ-123"})
+
     def test_extract_ticket_keys_none(self):
         """Test with None."""
         keys = JiraClient.extract_ticket_keys(None)
         self.assertEqual(keys, set())
 
 
+def make_issue(key, summary="Summary"):
+    """Build a minimal stand-in for a jira Issue."""
+    issue = Mock(key=key)
+    issue.fields.summary = summary
+    issue.fields.description = None
+    issue.fields.project.key = key.split("-")[0]
+    issue.fields.project.name = "Feature UI"
+    issue.fields.issuetype.name = "Story"
+    issue.fields.status.name = "Done"
+    issue.fields.assignee = None
+    return issue
+
+
+class TestJiraClientRequests(unittest.TestCase):
+    """Test Jira client ticket and project lookups."""
+
+    def setUp(self):
+        """Set up a client with a mocked Jira connection."""
+        with patch("src.jira_client.JIRA"):
+            self.client = JiraClient("https://jira.example.com", "a@b.c", "token")
+
+    def test_connection_pool_sized_for_workers(self):
+        """Test that the HTTP pool keeps a connection per concurrent worker."""
+        with patch("src.jira_client.JIRA"):
+            client = JiraClient(
+                "https://jira.example.com", "a@b.c", "token", max_workers=32
+            )
+
+        adapter = client.jira._session.mount.call_args_list[0][0][1]
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_get_tickets(self):
+        """Test fetching several tickets, skipping ones that don't exist."""
+
+        def issue(key):
+            if key == "FUI-9":
+                raise JIRAError(status_code=404)
+            return make_issue(key)
+
+        self.client.jira.issue.side_effect = issue
+
+        tickets = self.client.get_tickets({"FUI-0", "FUI-1", "FUI-9"})
+
+        self.assertEqual(set(tickets), {"FUI-0", "FUI-1"})
+        self.assertEqual(tickets["FUI-0"]["project_key"], "FUI")
+        self.assertEqual(tickets["FUI-0"]["description"], "")
+        self.assertEqual(
+            tickets["FUI-1"]["url"], "https://jira.example.com/browse/FUI-1"
+        )
+
+    def test_get_tickets_batches_search(self):
+        """Test that tickets come from one JQL search, with per-key fallback."""
+        self.client.jira.search_issues.return_value = [make_issue("FUI-0")]
+        self.client.jira.issue.side_effect = make_issue
+
+        tickets = self.client.get_tickets({"FUI-0", "FUI-1"})
+
+        self.assertEqual(set(tickets), {"FUI-0", "FUI-1"})
+        self.client.jira.search_issues.assert_called_once()
+        self.assertIn("key in (", self.client.jira.search_issues.call_args[0][0])
+        self.client.jira.issue.assert_called_once_with("FUI-1")
+
+    def test_get_tickets_batches_per_project(self):
+        """Test that each project's keys are searched separately."""
+
+        def search_issues(jql, **kwargs):
+            if "UTF-8" in jql:
+                raise JIRAError(status_code=400)
+            keys = jql[len("key in (") : -1].split(",")
+            return [make_issue(key) for key in keys]
+
+        self.client.jira.search_issues.side_effect = search_issues
+        self.client.jira.issue.side_effect = JIRAError(status_code=404)
+
+        tickets = self.client.get_tickets({"PROJ-1", "FUI-1", "UTF-8", "FUI-0"})
+
+        self.assertEqual(set(tickets), {"FUI-0", "FUI-1", "PROJ-1"})
+        queries = [c[0][0] for c in self.client.jira.search_issues.call_args_list]
+        self.assertEqual(
+            sorted(queries),
+            ["key in (FUI-0,FUI-1)", "key in (PROJ-1)", "key in (UTF-8)"],
+        )
+        self.client.jira.issue.assert_called_once_with("UTF-8")
+
+    def test_get_ticket_cached(self):
+        """Test that tickets, including missing ones, are fetched only once."""
+        self.client.jira.issue.side_effect = JIRAError(status_code=404)
+
+        self.assertIsNone(self.client.get_ticket("FUI-9"))
+        self.assertIsNone(self.client.get_ticket("FUI-9"))
+        self.assertEqual(self.client.get_tickets({"FUI-9"}), {})
+        self.client.jira.issue.assert_called_once_with("FUI-9")
+
+    @patch("src.jira_client.time.sleep")
+    def test_rate_limit_honors_retry_after(self, sleep):
+        """Test that a 429 waits for the server's Retry-After before retrying."""
+        response = Mock(headers={"Retry-After": "7"})
+        self.client.jira.issue.side_effect = [
+            JIRAError(status_code=429, response=response),
+            make_issue("FUI-0"),
+        ]
+
+        ticket = self.client.get_ticket("FUI-0")
+
+        self.assertEqual(ticket["key"], "FUI-0")
+        sleep.assert_called_once_with(7.0)
+
+    def test_get_project_info_cached(self):
+        """Test that each project is fetched from Jira only once."""
+        project = Mock(key="FUI", description="")
+        project.name = "Feature UI"
+        self.client.jira.projects.return_value = []
+        self.client.jira.project.return_value = project
+
+        first = self.client.get_project_info("FUI")
+        second = self.client.get_project_info("FUI")
+
+        self.assertEqual(first, {"key": "FUI", "name": "Feature UI", "description": ""})
+        self.assertEqual(first, second)
+        self.client.jira.project.assert_called_once_with("FUI")
+
+    def test_get_project_info_uses_project_list(self):
+        """Test that projects are looked up from a single projects() request."""
+        projects = [Mock(key="FUI", description=None), Mock(key="API")]
+        projects[0].name = "Feature UI"
+        projects[1].name = "Public API"
+        self.client.jira.projects.return_value = projects
+        self.client.jira.project.side_effect = JIRAError(status_code=404)
+
+        self.assertEqual(self.client.get_project_info("FUI")["name"], "Feature UI")
+        self.assertEqual(self.client.get_project_info("API")["name"], "Public API")
+        self.assertIsNone(self.client.get_project_info("UTF"))
+        self.client.jira.projects.assert_called_once_with()
+        self.client.jira.project.assert_called_once_with("UTF")
+
+    def test_concurrent_lookups_wait_for_project_list(self):
+        """Test that lookups during the projects() request use its result."""
+        listing_started = threading.Event()
+        release_listing = threading.Event()
+        projects = [Mock(key="FUI", description=""), Mock(key="API", description="")]
+        projects[0].name = "Feature UI"
+        projects[1].name = "Public API"
+
+        def list_projects():
+            listing_started.set()
+            release_listing.wait(5)
+            return projects
+
+        self.client.jira.projects.side_effect = list_projects
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(self.client.get_project_info, "FUI")
+            listing_started.wait(5)
+            second = pool.submit(self.client.get_project_info, "API")
+            release_listing.set()
+            names = [first.result()["name"], second.result()["name"]]
+
+        self.assertEqual(names, ["Feature UI", "Public API"])
+        self.client.jira.projects.assert_called_once_with()
+        self.client.jira.project.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -56,6 +56,17 @@ class TestReportGenerator(unittest.TestCase):
         self.assertIn("2024", str(start_date))
         self.assertIn("2024", str(end_date))
 
+    def test_find_insertion_row(self):
+        """Test finding the first fillable project row."""
+        generator = ReportGenerator(self.template_path)
+        generator.load_template()
+
+        self.assertEqual(generator.find_insertion_row(), 7)
+
+        # Rows whose column A holds text are not project rows
+        generator.ws.cell(row=7, column=1).value = "Header"
+        self.assertEqual(generator.find_insertion_row(), 10)
+
     def test_insert_project(self):
         """Test filling a project entry."""
         generator = ReportGenerator(self.template_path)
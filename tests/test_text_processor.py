@@ -0,0 +1,612 @@
+"""Tests for AI text processor."""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from openai import InternalServerError, RateLimitError
+from src.text_processor import TextProcessor
+
+
+def make_project(
+    key,
+    commit_messages=(
+        "feat: add login page with remember-me support",
+        "fix: validate email and password fields",
+    ),
+):
+    """Build summary data as produced by DataProcessor."""
+    return {
+        "project_key": key,
+        "project_name": f"Project {key}",
+        "commit_messages": list(commit_messages),
+        "ticket_summaries": [],
+        "ticket_descriptions": [],
+        "metrics": {"total_commits": len(commit_messages)},
+    }
+
+
+def make_response(content):
+    """Build a stand-in for an OpenAI Responses API result."""
+    return Mock(output_text=content)
+
+
+def make_events(content):
+    """Split a response into streamed text delta events, one per line."""
+    return [
+        Mock(type="response.output_text.delta", delta=line)
+        for line in content.splitlines(keepends=True)
+    ]
+
+
+def make_stream(content):
+    """Build a stand-in for a streamed Responses API result."""
+    stream = MagicMock()
+    stream.__enter__.return_value = make_events(content)
+    return stream
+
+
+def make_rate_limit_error(retry_after="2"):
+    """Build an OpenAI 429 error carrying a Retry-After header."""
+    response = Mock(status_code=429, headers={"Retry-After": retry_after})
+    return RateLimitError("Too many requests", response=response, body=None)
+
+
+class AsyncStream:
+    """Stand-in for an asynchronous streamed Responses API result."""
+
+    def __init__(self, content):
+        self.events = make_events(content)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+
+
+class TestTextProcessor(unittest.TestCase):
+    """Test text processor."""
+
+    def setUp(self):
+        """Set up a processor with a mocked OpenAI client."""
+        mocks = {}
+        for name in (
+            "OpenAI",
+            "AsyncOpenAI",
+            "DefaultHttpxClient",
+            "DefaultAsyncHttpxClient",
+        ):
+            patcher = patch(f"src.text_processor.{name}")
+            mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.processor = TextProcessor(api_key="key", use_cache=False)
+        self.create = self.processor.client.responses.create
+        self.stream = self.processor.client.responses.stream
+        # agenerate_all creates an async client per run
+        self.async_openai = mocks["AsyncOpenAI"]
+        self.async_openai.return_value.close = AsyncMock()
+        self.astream = self.async_openai.return_value.responses.stream
+
+    @patch("src.text_processor._HTTP2_AVAILABLE", True)
+    @patch("src.text_processor.DefaultAsyncHttpxClient")
+    @patch("src.text_processor.DefaultHttpxClient")
+    @patch("src.text_processor.AsyncOpenAI")
+    @patch("src.text_processor.OpenAI")
+    def test_clients_use_http2_when_available(
+        self, openai, async_openai, http_client, async_http_client
+    ):
+        """Test that both clients get HTTP/2 transports and no built-in retries."""
+        async_openai.return_value.close = AsyncMock()
+        TextProcessor(api_key="key", use_cache=False).generate_all([])
+
+        http_client.assert_called_once_with(http2=True)
+        async_http_client.assert_called_once_with(http2=True)
+        self.assertEqual(
+            openai.call_args.kwargs["http_client"], http_client.return_value
+        )
+        self.assertEqual(
+            async_openai.call_args.kwargs["http_client"],
+            async_http_client.return_value,
+        )
+        self.assertEqual(openai.call_args.kwargs["max_retries"], 0)
+
+    def test_no_cache_without_path_or_client(self):
+        """Test that the cache is off without a path or a working client."""
+        no_path = TextProcessor(api_key="key", cache_path=None)
+        self.assertIsNone(no_path._cache)
+        # Lookups skip the cache instead of failing on a missing path
+        self.assertEqual(no_path._cached_response("prompt"), (None, None))
+
+        with patch("src.text_processor.OpenAI", side_effect=RuntimeError("boom")):
+            failed = TextProcessor(api_key="key")
+        self.assertFalse(failed.use_ai)
+        self.assertIsNone(failed._cache)
+
+    def test_parse_summary_response(self):
+        """Test parsing a structured AI response."""
+        summary = self.processor._parse_summary_response(
+            "DESCRIPTION: Login flow for the customer portal.\n"
+            "DETAILS: Added a login page with validation\n"
+            "and remember-me support.\n"
+            "TECHNICAL: React form components."
+        )
+
+        self.assertEqual(
+            summary["description"], "Login flow for the customer portal."
+        )
+        self.assertEqual(
+            summary["creative_work_details"],
+            "Added a login page with validation and remember-me support.",
+        )
+        self.assertEqual(summary["technical_summary"], "React form components.")
+
+    def test_prompts_share_instruction_prefix(self):
+        """Test that project-specific text comes after the fixed instructions."""
+        prompts = [
+            self.processor._build_prompt(make_project(key), f"- {key} work")
+            for key in ("WEB", "BILL")
+        ]
+
+        prefix = prompts[0].split("PROJECT: Project WEB")[0]
+        self.assertIn("Example format:", prefix)
+        self.assertTrue(prompts[1].startswith(prefix))
+        self.assertTrue(prompts[1].endswith("WORK DETAILS:\n- BILL work\n"))
+
+    def test_input_text_capped_by_character_budget(self):
+        """Test that work details never exceed the character budget."""
+        project = make_project("WEB", ["fix: small change"])
+        project["ticket_summaries"] = ["x" * 3000] * 10
+
+        text = self.processor._build_input_text(project)
+
+        self.assertLessEqual(len(text), 8000)
+        self.assertEqual(text.count("- " + "x" * 3000), 2)
+        self.assertTrue(text.endswith("Commit Messages:\n- fix: small change"))
+
+    def test_input_items_cut_by_tokens(self):
+        """Test that items are cut to a token budget when an encoding is set."""
+        # One token per word
+        self.processor._encoding = Mock(
+            encode=lambda text: text.split(" "), decode=" ".join
+        )
+        project = make_project("WEB", ["word " * 100])
+        project["ticket_descriptions"] = ["word " * 100]
+
+        text = self.processor._build_input_text(project)
+
+        self.assertIn("- " + " ".join(["word"] * 60) + "\n", text)
+        self.assertTrue(text.endswith("- " + " ".join(["word"] * 40)))
+
+    def test_sparse_projects_skip_ai(self):
+        """Test that a single short commit is summarized without a request."""
+        summary = self.processor.generate_project_summary(
+            make_project("WEB", ["fix: typo"])
+        )
+
+        self.assertEqual(
+            summary["creative_work_details"], "Made 1 commit(s) with 1 fixes."
+        )
+        self.stream.assert_not_called()
+
+    def test_simple_summary_classifies_commits(self):
+        """Test commit categories, in priority and first-seen order."""
+        project = make_project(
+            "WEB",
+            [
+                "Fix login feature",  # "feature" anywhere wins over "fix"
+                "fix: null check",
+                "Update debug logging",  # "bug" anywhere counts as a fix
+                "refactor: split module",
+                "docs: readme",
+            ],
+        )
+
+        summary = TextProcessor(use_ai=False).generate_project_summary(project)
+
+        self.assertEqual(
+            summary["creative_work_details"],
+            "Made 5 commit(s) with 1 features, 2 fixes, 1 refactoring, "
+            "1 improvements.",
+        )
+
+    def test_batched_summaries_use_one_request(self):
+        """Test that several projects are summarized with a single request."""
+        self.create.return_value = make_response(
+            "PROJECT 1 DESCRIPTION: Login flow for the customer portal.\n"
+            "PROJECT 1 DETAILS: Added a login page with validation.\n"
+            "PROJECT 1 TECHNICAL: React form components.\n"
+            "PROJECT 2 DESCRIPTION: Billing service for monthly invoices.\n"
+            "PROJECT 2 DETAILS: Implemented invoice generation and emails.\n"
+            "PROJECT 2 TECHNICAL: Celery tasks and PDF rendering.\n"
+        )
+
+        summaries = self.processor.generate_project_summaries_batched(
+            [make_project("WEB"), make_project("BILL")]
+        )
+
+        self.create.assert_called_once()
+        prompt = self.create.call_args.kwargs["input"]
+        self.assertIn("=== PROJECT 2: Project BILL ===", prompt)
+        self.assertEqual(
+            [s["description"] for s in summaries],
+            [
+                "Login flow for the customer portal.",
+                "Billing service for monthly invoices.",
+            ],
+        )
+
+    def test_batched_summaries_fall_back_per_project(self):
+        """Test that projects missing from a batched response are re-requested."""
+        self.create.return_value = make_response(
+            "PROJECT 1 DESCRIPTION: Login flow for the customer portal.\n"
+            "PROJECT 1 DETAILS: Added a login page with validation.\n"
+            "PROJECT 1 TECHNICAL: React form components.\n"
+        )
+        self.stream.return_value = make_stream(
+            "DESCRIPTION: Billing service for monthly invoices.\n"
+            "DETAILS: Implemented invoice generation and emails.\n"
+            "TECHNICAL: Celery tasks and PDF rendering.\n"
+        )
+
+        summaries = self.processor.generate_project_summaries_batched(
+            [make_project("WEB"), make_project("BILL"), make_project("EMPTY", ())]
+        )
+
+        self.create.assert_called_once()
+        self.stream.assert_called_once()
+        self.assertEqual(
+            summaries[1]["description"], "Billing service for monthly invoices."
+        )
+        self.assertEqual(
+            summaries[2]["technical_summary"], "No detailed information available."
+        )
+
+    def test_generate_all_runs_requests_concurrently(self):
+        """Test that summaries run concurrently, bounded, and keep input order."""
+        in_flight = []
+        peak = []
+
+        class TrackedStream(AsyncStream):
+            async def __aenter__(self):
+                in_flight.append(1)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                return self
+
+            async def __aexit__(self, *exc_info):
+                in_flight.pop()
+                return False
+
+        def stream(**kwargs):
+            name = kwargs["input"].split("PROJECT: ", 1)[1].split("\n", 1)[0]
+            return TrackedStream(
+                f"DESCRIPTION: Summary of the {name} work.\n"
+                "DETAILS: Added a login page with validation.\n"
+                "TECHNICAL: React form components."
+            )
+
+        self.astream.side_effect = stream
+        projects = [make_project(f"P{i}") for i in range(5)]
+
+        summaries = self.processor.generate_all(projects, concurrency=2)
+
+        self.assertEqual(
+            [s["description"] for s in summaries],
+            [f"Summary of the Project P{i} work." for i in range(5)],
+        )
+        self.assertEqual(max(peak), 2)
+        self.stream.assert_not_called()
+
+    def test_stream_stops_once_summary_complete(self):
+        """Test that streaming stops after the TECHNICAL section ends."""
+        events = make_events(
+            "DESCRIPTION: Login flow for the customer portal.\n"
+            "DETAILS: Added a login page with validation.\n"
+            "TECHNICAL: React form components\n"
+            "and hooks.\n"
+            "\n"
+            "Let me know if you need anything else.\n"
+        )
+        remaining = iter(events)
+        self.stream.return_value.__enter__.return_value = remaining
+
+        summary = self.processor.generate_project_summary(make_project("WEB"))
+
+        self.assertEqual(
+            summary["technical_summary"], "React form components and hooks."
+        )
+        # The trailing remark was never read
+        self.assertEqual(list(remaining), events[-1:])
+
+    def test_stream_stops_after_one_line_technical_section(self):
+        """Test stopping after a TECHNICAL section on the header line."""
+        events = make_events(
+            "DESCRIPTION: Login flow for the customer portal.\n"
+            "\n"
+            "DETAILS: Added a login page with validation.\n"
+            "\n"
+            "TECHNICAL: React form components.\n"
+            "\n"
+            "Let me know if you need anything else.\n"
+        )
+        remaining = iter(events)
+        self.stream.return_value.__enter__.return_value = remaining
+
+        summary = self.processor.generate_project_summary(make_project("WEB"))
+
+        self.assertEqual(summary["technical_summary"], "React form components.")
+        self.assertEqual(list(remaining), events[-1:])
+
+    def test_stream_continues_after_lead_in_line(self):
+        """Test that a blank line after a lead-in does not end TECHNICAL."""
+        self.stream.return_value = make_stream(
+            "DESCRIPTION: Login flow for the customer portal.\n"
+            "DETAILS: Added a login page with validation.\n"
+            "TECHNICAL: Key points:\n"
+            "\n"
+            "React form components.\n"
+        )
+
+        summary = self.processor.generate_project_summary(make_project("WEB"))
+
+        self.assertEqual(
+            summary["technical_summary"], "Key points: React form components."
+        )
+
+    def test_early_stopped_stream_not_cached(self):
+        """Test that a stream cut after a TECHNICAL paragraph is not cached."""
+        self.processor._cache = Mock()
+        self.processor._cache.get.return_value = None
+        remaining = iter(
+            make_events(
+                "DESCRIPTION: Login flow for the customer portal.\n"
+                "DETAILS: Added a login page with validation.\n"
+                "TECHNICAL: React form components.\n"
+                "\n"
+                "Validation uses a shared schema module.\n"
+            )
+        )
+        self.stream.return_value.__enter__.return_value = remaining
+
+        summary = self.processor.generate_project_summary(make_project("WEB"))
+
+        # The second paragraph may belong to the section; only this run
+        # uses the shortened response
+        self.assertEqual(summary["technical_summary"], "React form components.")
+        self.assertEqual(len(list(remaining)), 1)
+        self.processor._cache.set.assert_not_called()
+
+    def test_generate_all_uses_fresh_async_client_per_run(self):
+        """Test that each run gets its own async client and closes it."""
+        self.astream.side_effect = lambda **kwargs: AsyncStream(
+            "DESCRIPTION: Login flow for the customer portal.\n"
+            "DETAILS: Added a login page with validation.\n"
+            "TECHNICAL: React form components."
+        )
+
+        for _ in range(2):
+            summaries = self.processor.generate_all([make_project("WEB")])
+            self.assertEqual(
+                summaries[0]["description"], "Login flow for the customer portal."
+            )
+
+        self.assertEqual(self.async_openai.call_count, 2)
+        self.assertEqual(self.async_openai.return_value.close.await_count, 2)
+
+    def test_close_closes_client(self):
+        """Test that closing the processor closes its OpenAI client."""
+        self.processor.close()
+
+        self.processor.client.close.assert_called_once_with()
+
+    def test_generate_all_falls_back_on_error(self):
+        """Test that a failed async request falls back to a simple summary."""
+        self.astream.side_effect = RuntimeError("boom")
+
+        summaries = self.processor.generate_all([make_project("WEB")])
+
+        self.assertEqual(summaries[0]["description"], "Development work on Project WEB")
+
+    @patch("src.text_processor.time.sleep")
+    def test_rate_limited_request_retried(self, sleep):
+        """Test that 429s are retried after Retry-After and slow the limiter."""
+        self.processor.rate_limiter = Mock()
+        self.stream.side_effect = [
+            make_rate_limit_error(),
+            make_stream(
+                "DESCRIPTION: Login flow for the customer portal.\n"
+                "DETAILS: Added a login page with validation.\n"
+                "TECHNICAL: React form components."
+            ),
+        ]
+
+        summary = self.processor.generate_project_summary(make_project("WEB"))
+
+        self.assertEqual(summary["description"], "Login flow for the customer portal.")
+        sleep.assert_called_once_with(2.0)
+        self.processor.rate_limiter.on_throttled.assert_called_once()
+        self.assertEqual(self.processor.rate_limiter.acquire.call_count, 2)
+
+    @patch("src.text_processor.asyncio.sleep", new_callable=AsyncMock)
+    def test_async_retries_exhausted_fall_back(self, sleep):
+        """Test that a request failing every attempt falls back."""
+        self.processor.max_retries = 2
+        self.astream.side_effect = make_rate_limit_error()
+
+        summaries = self.processor.generate_all([make_project("WEB")])
+
+        self.assertEqual(summaries[0]["description"], "Development work on Project WEB")
+        self.assertEqual(self.astream.call_count, 3)
+        self.assertEqual(sleep.await_count, 2)
+
+    def test_responses_cached_on_disk(self):
+        """Test that identical requests are answered from the cache."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = str(Path(tmp) / "summaries")
+            with patch("src.text_processor.OpenAI") as openai, patch(
+                "src.text_processor.AsyncOpenAI"
+            ):
+                stream = openai.return_value.responses.stream
+                stream.side_effect = [
+                    make_stream(
+                        "DESCRIPTION: Login flow for the customer portal.\n"
+                        "DETAILS: Added a login page with validation.\n"
+                        "TECHNICAL: React form components."
+                    ),
+                    RuntimeError("boom"),
+                ]
+                first = TextProcessor(api_key="key", cache_path=cache_path)
+                summary = first.generate_project_summary(make_project("WEB"))
+                # Failed requests are not cached
+                first.generate_project_summary(make_project("API"))
+                first.close()
+
+                second = TextProcessor(api_key="key", cache_path=cache_path)
+                cached = second.generate_project_summary(make_project("WEB"))
+                second.close()
+
+        self.assertEqual(cached, summary)
+        self.assertEqual(stream.call_count, 2)
+        self.assertEqual(first.stats, {"hits": 0, "misses": 2})
+        self.assertEqual(second.stats, {"hits": 1, "misses": 0})
+
+    @patch("src.text_processor.time.sleep")
+    def test_summaries_via_batch_api(self, sleep):
+        """Test submitting summaries as a batch and mapping results back."""
+        client = self.processor.client
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="validating")
+        client.batches.retrieve.return_value = Mock(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        body = {
+            "output": [
+                {
+                    "type": "message",
+                    "content": [
+                        {
+                            "type": "output_text",
+                            "text": "DESCRIPTION: Login flow for the customer portal.\n"
+                            "DETAILS: Added a login page with validation.\n"
+                            "TECHNICAL: React form components.",
+                        }
+                    ],
+                }
+            ]
+        }
+        results = [
+            {"custom_id": "project-0", "response": {"status_code": 200, "body": body}},
+            {"custom_id": "project-1", "response": {"status_code": 500, "body": {}}},
+        ]
+        client.files.content.return_value = Mock(
+            text="\n".join(json.dumps(result) for result in results)
+        )
+        self.stream.return_value = make_stream(
+            "DESCRIPTION: Billing service for monthly invoices.\n"
+            "DETAILS: Implemented invoice generation and emails.\n"
+            "TECHNICAL: Celery tasks and PDF rendering."
+        )
+
+        summaries = self.processor.generate_project_summaries_via_batch(
+            [make_project("WEB"), make_project("BILL"), make_project("EMPTY", ())]
+        )
+
+        self.assertEqual(
+            [s["description"] for s in summaries],
+            [
+                "Login flow for the customer portal.",
+                "Billing service for monthly invoices.",
+                "Work on Project EMPTY",
+            ],
+        )
+        client.batches.create.assert_called_once_with(
+            input_file_id="file-in", endpoint="/v1/responses", completion_window="24h"
+        )
+        sleep.assert_called_once_with(30.0)
+        # The failed batch request was retried on its own
+        self.stream.assert_called_once()
+
+    @patch("src.text_processor.time.sleep")
+    def test_batch_api_skips_malformed_output_lines(self, sleep):
+        """Test that bad output lines fall back to individual requests."""
+        client = self.processor.client
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        # A truncated line and a line without a custom_id
+        client.files.content.return_value = Mock(
+            text='{"custom_id": "project-0", "resp\n{"response": {"status_code": 200}}'
+        )
+        self.stream.return_value = make_stream(
+            "DESCRIPTION: Login flow for the customer portal.\n"
+            "DETAILS: Added a login page with validation.\n"
+            "TECHNICAL: React form components."
+        )
+
+        summaries = self.processor.generate_project_summaries_via_batch(
+            [make_project("WEB")]
+        )
+
+        self.assertEqual(
+            summaries[0]["description"], "Login flow for the customer portal."
+        )
+        self.stream.assert_called_once()
+
+    @patch("src.text_processor.time.sleep")
+    def test_batch_api_poll_retried_after_server_error(self, sleep):
+        """Test that a failed status check does not abandon a running batch."""
+        client = self.processor.client
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.batches.retrieve.side_effect = [
+            InternalServerError(
+                "Server error", response=Mock(status_code=500, headers={}), body=None
+            ),
+            Mock(id="batch-1", status="completed", output_file_id="file-out"),
+        ]
+        body = {
+            "output": [
+                {
+                    "type": "message",
+                    "content": [
+                        {
+                            "type": "output_text",
+                            "text": "DESCRIPTION: Login flow for the customer portal.\n"
+                            "DETAILS: Added a login page with validation.\n"
+                            "TECHNICAL: React form components.",
+                        }
+                    ],
+                }
+            ]
+        }
+        client.files.content.return_value = Mock(
+            text=json.dumps(
+                {
+                    "custom_id": "project-0",
+                    "response": {"status_code": 200, "body": body},
+                }
+            )
+        )
+
+        summaries = self.processor.generate_project_summaries_via_batch(
+            [make_project("WEB")]
+        )
+
+        self.assertEqual(
+            summaries[0]["description"], "Login flow for the customer portal."
+        )
+        self.assertEqual(client.batches.retrieve.call_count, 2)
+        client.batches.create.assert_called_once()
+        self.stream.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Tests for utility helpers."""
+
+import os
+import tempfile
+import unittest
+import yaml
+from unittest.mock import patch
+from dataclasses import FrozenInstanceError
+from src.utils import (
+    AppConfig,
+    RateLimiter,
+    _read_config_file,
+    get_backoff_delay,
+    load_config,
+)
+
+
+class TestGetBackoffDelay(unittest.TestCase):
+    """Test retry delay calculation."""
+
+    def test_retry_after_beyond_max_delay_is_honored(self):
+        """Test that the server's Retry-After wins over the backoff cap."""
+        self.assertEqual(get_backoff_delay(0, "60", max_delay=30.0), 60.0)
+
+    def test_retry_after_has_upper_bound(self):
+        """Test that absurd Retry-After values are bounded."""
+        self.assertEqual(get_backoff_delay(0, "86400"), 600.0)
+
+    def test_backoff_without_retry_after(self):
+        """Test capped exponential backoff with jitter."""
+        delay = get_backoff_delay(10, None, max_delay=30.0)
+        self.assertTrue(15.0 <= delay <= 30.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token bucket rate limiter."""
+
+    def setUp(self):
+        """Patch the clock so waits are computed but never slept."""
+        self.now = 0.0
+        self.sleeps = []
+        patcher = patch("src.utils.time")
+        mock_time = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_time.monotonic.side_effect = lambda: self.now
+        mock_time.sleep.side_effect = self.sleeps.append
+
+    def test_burst_does_not_wait(self):
+        """Test that requests within the bucket capacity run immediately."""
+        limiter = RateLimiter(requests_per_minute=60, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(self.sleeps, [])
+
+    def test_waits_when_bucket_empty(self):
+        """Test that callers queue up once the bucket is empty."""
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+
+    def test_refills_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+        limiter.acquire()
+        self.now = 1.0
+        limiter.acquire()
+        self.assertEqual(self.sleeps, [])
+
+    def test_throttling_halves_rate_and_success_recovers(self):
+        """Test AIMD adjustment of the request rate."""
+        limiter = RateLimiter(requests_per_minute=60, min_requests_per_minute=20)
+        limiter.on_throttled()
+        self.assertAlmostEqual(limiter.rate, 0.5)
+        limiter.on_throttled()
+        limiter.on_throttled()
+        self.assertAlmostEqual(limiter.rate, 20 / 60)
+        for _ in range(20):
+            limiter.on_success()
+        self.assertAlmostEqual(limiter.rate, 1.0)
+
+
+class TestAppConfig(unittest.TestCase):
+    """Test typed application settings."""
+
+    def setUp(self):
+        """Set up a configuration dictionary."""
+        self.cfg = {
+            "github": {"token": "gh", "organizations": ["myorg"], "repositories": []},
+            "jira": {"url": "https://jira", "max_workers": 4},
+            "openai": {"model": "gpt-5.1"},
+            "report": {"company_name": "Acme", "default_year": None},
+        }
+
+    def test_from_dict(self):
+        """Test building settings from a configuration dictionary."""
+        app_config = AppConfig.from_dict(self.cfg)
+
+        self.assertEqual(app_config.github_token, "gh")
+        self.assertEqual(app_config.organizations, ("myorg",))
+        self.assertEqual(app_config.repositories, ())
+        self.assertEqual(app_config.jira_max_workers, 4)
+        self.assertEqual(app_config.jira_max_retries, 3)
+        self.assertEqual(app_config.openai_model, "gpt-5.1")
+        self.assertEqual(app_config.company_name, "Acme")
+        self.assertIsNone(app_config.openai_api_key)
+
+    def test_overrides_take_precedence(self):
+        """Test that non-empty overrides replace configured values."""
+        app_config = AppConfig.from_dict(
+            self.cfg, github_token="cli", company_name=None, organizations=()
+        )
+
+        self.assertEqual(app_config.github_token, "cli")
+        self.assertEqual(app_config.company_name, "Acme")
+        self.assertEqual(app_config.organizations, ("myorg",))
+
+    def test_is_frozen(self):
+        """Test that settings cannot be modified."""
+        app_config = AppConfig.from_dict(self.cfg)
+        with self.assertRaises(FrozenInstanceError):
+            app_config.github_token = "other"
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test loading the config file and environment overrides."""
+
+    def setUp(self):
+        """Write a config file and keep the real .env file out of the test."""
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as f:
+            f.write(
+                "github:\n  token: file\n  organizations: []\n"
+                "jira: {}\nopenai: {}\nreport:\n  company_name: Acme\n"
+            )
+        self.path = f.name
+        self.addCleanup(os.remove, self.path)
+        _read_config_file.cache_clear()
+        patcher = patch("dotenv.load_dotenv")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.dict(
+        os.environ,
+        {"GITHUB_TOKEN": "env", "GITHUB_ORGANIZATIONS": "a, ,b", "COMPANY_NAME": ""},
+    )
+    def test_environment_overrides(self):
+        """Test that non-empty environment variables replace file values."""
+        config = load_config(self.path)
+
+        self.assertEqual(config["github"]["token"], "env")
+        self.assertEqual(config["github"]["organizations"], ["a", "b"])
+        self.assertEqual(config["report"]["company_name"], "Acme")
+
+    def test_file_parsed_once_and_copied(self):
+        """Test that repeated loads reuse the parsed file without sharing it."""
+        with patch("src.utils.yaml.load", wraps=yaml.load) as load:
+            first = load_config(self.path)
+            first["report"]["company_name"] = "Changed"
+            second = load_config(self.path)
+
+        load.assert_called_once()
+        self.assertEqual(second["report"]["company_name"], "Acme")
+
+
+if __name__ == "__main__":
+    unittest.main()